@@ -0,0 +1,232 @@
+'''
+🌊 Async File Pipeline — "Read Many Files at Once"
+Idea: 10. FileOperation.py reads files strictly one after another:
+
+        if os.path.exists(filePath):          # blocking call #1
+            with open(filePath, 'r') as file: # blocking call #2, #3 ...
+                print(file.read())
+
+    For 100K small files the CPU is mostly idle - it is waiting for the disk / network share to
+    answer. Files can be read while we wait on others:
+
+        1. a ThreadPoolExecutor does the blocking open() / read() calls (threads release the GIL
+           while waiting for I/O)
+        2. asyncio hands paths to the pool and collects results as they finish
+        3. at most `max_in_flight` reads are running or waiting to be consumed (backpressure):
+           if the consumer is slow, we stop starting new reads instead of piling results in memory
+
+    The os.path.exists() check is gone: trying to open the file and catching FileNotFoundError
+    is one call instead of two ("easier to ask forgiveness than permission").
+
+💡 Why useful?
+1. Wall time ≈ total waiting / number of concurrent reads
+   (for files already in the OS cache there is no waiting - a plain loop is faster there)
+2. Results arrive in COMPLETION order - a slow file doesn't hold up the fast ones
+3. Memory stays bounded, however many paths there are
+'''
+
+import asyncio
+import os
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+ReadResult = namedtuple("ReadResult", "path data error latency")
+
+
+# -------------------------------
+# LATENCY HISTOGRAM
+# -------------------------------
+class LatencyHistogram:
+    """Counts latencies in power-of-two millisecond buckets: <0.125, <0.25, ... ms."""
+
+    def __init__(self, smallest_ms=0.125, buckets=16):
+        self.edges = [smallest_ms * 2 ** i for i in range(buckets)]
+        self.counts = [0] * (buckets + 1)       # last bucket = everything above the top edge
+        self.samples = []
+
+    def record(self, seconds):
+        ms = seconds * 1000
+        self.samples.append(ms)
+        for i, edge in enumerate(self.edges):
+            if ms < edge:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def percentile(self, p):
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] if ordered else 0.0
+
+    def render(self, width=40):
+        top = max(self.counts) or 1
+        lines = []
+        for i, count in enumerate(self.counts):
+            if not count:
+                continue
+            label = f"< {self.edges[i]:g} ms" if i < len(self.edges) else f">= {self.edges[-1]:g} ms"
+            lines.append(f"  {label:>12} | {'#' * max(1, count * width // top):<{width}} {count:,}")
+        return "\n".join(lines)
+
+
+# -------------------------------
+# THE PIPELINE
+# -------------------------------
+def _read(path, mode, encoding=None, errors=None):
+    # Runs in a worker thread
+    start = time.perf_counter()
+    try:
+        with open(path, mode, encoding=encoding, errors=errors) as file:
+            data = file.read()
+        return ReadResult(path, data, None, time.perf_counter() - start)
+    # FileNotFoundError, PermissionError, ... and in text mode UnicodeDecodeError (a ValueError):
+    # one bad file is a result, not the end of the pipeline
+    except (OSError, ValueError) as error:
+        return ReadResult(path, None, error, time.perf_counter() - start)
+
+
+async def read_files(paths, workers=32, max_in_flight=64, mode="rb", encoding=None, errors=None,
+                     reader=_read):
+    """Async generator: yield a ReadResult for every path, in completion order.
+
+    `reader(path, mode, encoding, errors)` does the blocking work in a worker thread;
+    `encoding` / `errors` go to open() (text mode only).
+    """
+    loop = asyncio.get_running_loop()
+    paths = iter(paths)
+    pool = ThreadPoolExecutor(max_workers=workers)
+    in_flight = set()
+
+    def top_up():
+        while len(in_flight) < max_in_flight:
+            path = next(paths, None)
+            if path is None:
+                return
+            in_flight.add(loop.run_in_executor(pool, reader, path, mode, encoding, errors))
+
+    try:
+        top_up()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                yield future.result()           # Paused here until the consumer asks for more
+            top_up()                            # ... so new reads only start when there is room
+    finally:
+        # The consumer may stop early (break / aclose()). `with ThreadPoolExecutor` would then
+        # wait for the running reads ON the event loop thread - drop the queued ones and let
+        # the running ones finish in the background instead.
+        for future in in_flight:
+            future.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def ingest(paths, **options):
+    """Read everything, return (total bytes, errors, histogram, seconds)."""
+    histogram = LatencyHistogram()
+    total, errors = 0, []
+    start = time.perf_counter()
+    async for result in read_files(paths, **options):
+        histogram.record(result.latency)
+        if result.error is not None:
+            errors.append(result)
+        else:
+            total += len(result.data)
+    return total, errors, histogram, time.perf_counter() - start
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def serial_read(paths, delay=0.0):
+    """The 10. FileOperation.py way: exists() + open() + read(), one file after another."""
+    total = 0
+    for path in paths:
+        time.sleep(delay)
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                total += len(file.read())
+    return total
+
+
+def _slow_read(path, mode, encoding=None, errors=None, delay=0.001):
+    # Simulates a network share / cold disk: 1 ms of waiting before every read
+    time.sleep(delay)
+    return _read(path, mode, encoding, errors)
+
+
+def benchmark(count=20_000, size=2048, slow_count=2_000):
+    with tempfile.TemporaryDirectory() as folder:
+        paths = []
+        payload = os.urandom(size)
+        for i in range(count):
+            path = os.path.join(folder, f"file{i:06d}.bin")
+            with open(path, "wb") as file:
+                file.write(payload)
+            paths.append(path)
+        megabytes = count * size / 2**20
+
+        start = time.perf_counter()
+        serial_total = serial_read(paths)
+        serial_time = time.perf_counter() - start
+
+        total, errors, histogram, elapsed = asyncio.run(ingest(paths))
+        assert total == serial_total and not errors
+
+        print(f"{count:,} files of {size:,} bytes")
+        print(f"  serial      : {count / serial_time:10,.0f} files/s  {megabytes / serial_time:7.1f} MiB/s")
+        print(f"  async pool  : {count / elapsed:10,.0f} files/s  {megabytes / elapsed:7.1f} MiB/s"
+              f"  (p50 {histogram.percentile(50):.3f} ms, p99 {histogram.percentile(99):.3f} ms)")
+        print(histogram.render())
+
+        # Same pipeline when every read has to wait 1 ms
+        slow = paths[:slow_count]
+        start = time.perf_counter()
+        serial_read(slow, delay=0.001)
+        serial_time = time.perf_counter() - start
+        _, _, histogram, elapsed = asyncio.run(ingest(slow, reader=_slow_read))
+        print(f"{slow_count:,} files with 1 ms simulated storage latency")
+        print(f"  serial      : {slow_count / serial_time:10,.0f} files/s")
+        print(f"  async pool  : {slow_count / elapsed:10,.0f} files/s"
+              f"  (p50 {histogram.percentile(50):.3f} ms, p99 {histogram.percentile(99):.3f} ms)")
+
+
+async def demo():
+    with tempfile.TemporaryDirectory() as folder:
+        paths = []
+        for name in ("a.txt", "b.txt"):
+            path = os.path.join(folder, name)
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(f"Hello from {name}!")
+            paths.append(path)
+        paths.append(os.path.join(folder, "missing.txt"))
+        paths.append(os.path.join(folder, "latin1.txt"))
+        with open(paths[-1], "wb") as file:
+            file.write("Café".encode("latin-1"))        # Not valid UTF-8
+
+        async for result in read_files(paths, mode="r", encoding="utf-8"):
+            name = os.path.basename(result.path)
+            print(name, result.data if result.error is None else type(result.error).__name__)
+        # Output (completion order may vary):
+        # a.txt Hello from a.txt!
+        # b.txt Hello from b.txt!
+        # missing.txt FileNotFoundError
+        # latin1.txt UnicodeDecodeError
+
+
+if __name__ == "__main__":
+    asyncio.run(demo())
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Concurrent reads     | `loop.run_in_executor()` on a bounded `ThreadPoolExecutor`               |
+# | Completion order     | `asyncio.wait(..., return_when=FIRST_COMPLETED)`                         |
+# | Backpressure         | At most `max_in_flight` reads; refills only after results are consumed   |
+# | No exists() check    | Open and catch `OSError` instead (one call, no race)                     |
+# | Reporting            | files/s, MiB/s, p50 / p99 and a power-of-two latency histogram           |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,187 @@
+'''
+📎 Buffered Bulk Appender — "Open Once, Write in Batches"
+Idea: The append example in 10. FileOperation.py does this for every line:
+
+        with open('Python\\example.txt', 'a', encoding='utf-8') as file:
+            file.write("\\nAppended line.")
+
+    That is open() + write() + close() - three system calls and a file-system metadata update -
+    per event. In a service writing thousands of events per second, the file system spends its
+    time opening and closing the same file.
+
+    BufferedAppender keeps the file open and collects lines in memory. The buffer is written out:
+        1. when it reaches `buffer_size` bytes            (flush-on-size)
+        2. when `flush_interval` seconds have passed      (flush-on-interval)
+        3. optionally from a background thread, so quiet periods still get flushed
+        4. on flush() / close() / leaving the `with` block
+
+Durability modes (what happens on every buffer flush):
+    | Mode    | Data survives...           | Cost                             |
+    | ------- | -------------------------- | -------------------------------- |
+    | "none"  | nothing guaranteed         | data may stay in Python's buffer |
+    | "flush" | a crash of THIS process    | one write() to the OS            |
+    | "fsync" | a power cut / OS crash     | write() + os.fsync() (slow)      |
+
+💡 Why useful?
+1. One open() for the lifetime of the appender
+2. One write() per buffer instead of one per line
+3. You choose the trade-off between speed and durability
+'''
+
+import os
+import tempfile
+import threading
+import time
+
+DURABILITY_MODES = ("none", "flush", "fsync")
+
+
+# -------------------------------
+# BUFFERED APPENDER
+# -------------------------------
+class BufferedAppender:
+    """Thread-safe line appender with size / interval flushing."""
+
+    def __init__(self, path, buffer_size=1 << 20, flush_interval=None,
+                 background=False, durability="flush", encoding="utf-8"):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+        if background and not flush_interval:
+            raise ValueError("A background flush thread needs a flush_interval!")
+        self.path = path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self.encoding = encoding
+
+        self._file = open(path, "ab")
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self.flush_count = 0
+
+        self._stop = threading.Event()
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._thread.start()
+
+    # ---- writing ----
+    def write(self, text):
+        data = text.encode(self.encoding)
+        with self._lock:
+            self._buffer.append(data)
+            self._buffered += len(data)
+            if self._buffered >= self.buffer_size or self._interval_passed():
+                self._flush_locked()
+
+    def write_line(self, line):
+        self.write(line + "\n")
+
+    def write_lines(self, lines):
+        self.write("".join(line + "\n" for line in lines))
+
+    # ---- flushing ----
+    def _interval_passed(self):
+        return self.flush_interval is not None and \
+            time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _flush_locked(self):
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+            self.flush_count += 1
+        if self.durability != "none":
+            self._file.flush()                  # Python buffer -> OS
+        if self.durability == "fsync":
+            os.fsync(self._file.fileno())       # OS cache -> disk
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_periodically(self):
+        while not self._stop.wait(self.flush_interval):
+            with self._lock:
+                if self._buffer and self._interval_passed():
+                    self._flush_locked()
+
+    def close(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        with self._lock:
+            if self._file.closed:
+                return                          # Already closed (e.g. close() and then __exit__)
+            self._flush_locked()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# -------------------------------
+# BENCHMARK: open('a') PER LINE vs BufferedAppender
+# -------------------------------
+def open_per_write(path, lines):
+    for line in lines:
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+def benchmark(count=200_000):
+    lines = [f"2025-05-14 12:00:00 INFO event {i}" for i in range(count)]
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "naive.log")
+        start = time.perf_counter()
+        open_per_write(path, lines)
+        naive = time.perf_counter() - start
+        print(f"{count:,} lines")
+        print(f"  open('a') per line        : {count / naive:12,.0f} lines/s")
+
+        for durability in DURABILITY_MODES:
+            path = os.path.join(folder, f"{durability}.log")
+            start = time.perf_counter()
+            with BufferedAppender(path, buffer_size=256 * 1024, durability=durability) as appender:
+                for line in lines:
+                    appender.write_line(line)
+            elapsed = time.perf_counter() - start
+            with open(path, "rb") as file:
+                assert file.read().count(b"\n") == count
+            print(f"  BufferedAppender {durability:<6}   : {count / elapsed:12,.0f} lines/s"
+                  f"  ({appender.flush_count} buffer flushes)")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "example.txt")
+
+        with BufferedAppender(path, flush_interval=0.05, background=True) as appender:
+            appender.write_line("Appended line.")
+            print(os.path.getsize(path))            # Output: 0   (still in the buffer)
+            time.sleep(0.2)                         # Background thread flushes it
+            print(os.path.getsize(path))            # Output: 15
+            appender.write_lines(["second", "third"])
+
+        with open(path, "r", encoding="utf-8") as file:
+            print(file.read().splitlines())         # Output: ['Appended line.', 'second', 'third']
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | File opened once     | `open(path, 'ab')` for the appender's lifetime                           |
+# | Flush-on-size        | buffer written when it reaches `buffer_size` bytes                       |
+# | Flush-on-interval    | checked on every write, plus an optional background thread               |
+# | Durability modes     | "none" / "flush" (`file.flush()`) / "fsync" (`os.fsync()`)               |
+# | Thread safety        | one `threading.Lock` around the buffer and the file                      |
+# |______________________|__________________________________________________________________________|
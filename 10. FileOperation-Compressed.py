@@ -0,0 +1,208 @@
+'''
+🗜️ Compressed Files — "Same Code for .log and .log.gz"
+Idea: Everything in 10. FileOperation.py assumes plain files. Logs and exports compress 5-20x,
+    and Python's standard library already has three codecs:
+
+        | Codec | Module | Magic bytes          | Typical trade-off                      |
+        | ----- | ------ | -------------------- | -------------------------------------- |
+        | gzip  | gzip   | 1f 8b                | fast, decent ratio                     |
+        | bz2   | bz2    | "BZh"                | better ratio, slow                     |
+        | xz    | lzma   | fd "7zXZ" 00         | best ratio, slowest to write           |
+
+    open_file() looks at the first bytes of the file - NOT the extension - and returns a
+    file object that decompresses on the fly. Reading code stays the same:
+
+        with open_file(path, "rt") as file:      # plain, .gz, .bz2 or .xz
+            for line in file:
+                ...
+
+    The decompressed stream is wrapped in a 1 MiB buffer, so read() / readline() mostly copy
+    memory instead of calling the decompressor for a few bytes at a time.
+
+💡 Why useful?
+1. One reader for every file, whatever it was saved with
+2. count_lines() / iter_lines() give the same answers as for the plain file
+3. The benchmark shows what each codec costs on disk and in read speed
+'''
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import time
+
+from lessons import load_lesson
+
+BUFFER_SIZE = 1024 * 1024           # 1 MiB buffers around the (de)compressor
+BLOCK_SIZE = 8 * 1024 * 1024        # 8 MiB blocks for counting
+
+
+line_counter = load_lesson("line_counter")
+
+# name -> (magic bytes, opener, extension)
+CODECS = {
+    "gzip": (b"\x1f\x8b", gzip.open, ".gz"),
+    "bz2": (b"BZh", bz2.open, ".bz2"),
+    "xz": (b"\xfd7zXZ\x00", lzma.open, ".xz"),
+}
+
+
+# -------------------------------
+# DETECTION
+# -------------------------------
+def detect_compression(path):
+    """'gzip', 'bz2', 'xz' or None (plain file), from the magic bytes."""
+    with open(path, "rb") as file:
+        head = file.read(6)
+    for name, (magic, _, _) in CODECS.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def compression_for(path):
+    """Codec to WRITE with, chosen by extension: 'data.log.gz' -> 'gzip'."""
+    for name, (_, _, extension) in CODECS.items():
+        if str(path).endswith(extension):
+            return name
+    return None
+
+
+# -------------------------------
+# OPEN
+# -------------------------------
+def open_file(path, mode="rb", compression="auto", encoding="utf-8", newline=None,
+              level=None, buffer_size=BUFFER_SIZE):
+    """Like open(), but transparently (de)compresses.
+
+    compression="auto" detects the codec from the magic bytes when reading and from the
+    extension when writing; None forces a plain file.
+    """
+    binary_mode = mode.replace("t", "")
+    if binary_mode not in ("rb", "r", "wb", "w", "ab", "a", "xb", "x"):
+        raise ValueError(f"Unsupported mode: {mode!r}")
+    reading = binary_mode.startswith("r")
+    binary_mode = binary_mode[0] + "b"
+
+    if compression == "auto":
+        compression = detect_compression(path) if reading else compression_for(path)
+    if compression is None:
+        raw = open(path, binary_mode, buffering=buffer_size)
+    else:
+        if compression not in CODECS:
+            raise ValueError(f"Unknown compression {compression!r}, use one of {list(CODECS)}")
+        _, opener, _ = CODECS[compression]
+        options = {}
+        if level is not None and not reading:
+            options["preset" if compression == "xz" else "compresslevel"] = level
+        stream = opener(path, binary_mode, **options)
+        # Big buffer in front of the codec: fewer, larger calls into the (de)compressor
+        raw = io.BufferedReader(stream, buffer_size) if reading else io.BufferedWriter(stream, buffer_size)
+
+    if "b" in mode:
+        return raw
+    return io.TextIOWrapper(raw, encoding=encoding, newline=newline)
+
+
+# -------------------------------
+# LINE APIs
+# -------------------------------
+def iter_lines(path, encoding="utf-8"):
+    """Lines without their line break - like `line.strip()` in 10. FileOperation.py, ends only."""
+    with open_file(path, "rt", encoding=encoding) as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+def count_stream_lines(stream, universal=True, block_size=BLOCK_SIZE):
+    """Line count of an open binary stream - same rules as line_counter.count_range()."""
+    count = 0
+    last = b""
+    while block := stream.read(block_size):
+        count += block.count(b"\n")
+        if universal:
+            if b"\r" in block:
+                count += block.count(b"\r") - block.count(b"\r\n")
+            if last == b"\r" and block[:1] == b"\n":
+                count -= 1                              # \r\n split across two blocks
+        last = block[-1:]
+    if last and last not in ((b"\n", b"\r") if universal else (b"\n",)):
+        count += 1                                      # Last line without a line break
+    return count
+
+
+def count_lines(path, workers=None, universal=True):
+    """Same result as `for line in file: count += 1` - for plain and compressed files."""
+    if detect_compression(path) is None:
+        return line_counter.count_lines(path, workers=workers, universal=universal)
+    # A compressed stream can't be split into byte ranges - decompress it in one pass
+    with open_file(path, "rb") as file:
+        return count_stream_lines(file, universal)
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def make_lines(count):
+    levels = ("INFO", "INFO", "INFO", "WARN", "ERROR")
+    for i in range(count):
+        yield (f"2025-05-14 12:{i // 60 % 60:02d}:{i % 60:02d} {levels[i * 7 % 5]:<5} "
+               f"payroll run for employee {i * 2654435761 % 1_000_000:06d} took {i * 31 % 997} ms\n")
+
+
+def benchmark(lines=1_000_000):
+    settings = [(None, None), ("gzip", 1), ("gzip", 6), ("bz2", 9), ("xz", 0), ("xz", 6)]
+    with tempfile.TemporaryDirectory() as folder:
+        plain_size = None
+        print(f"{lines:,} log lines")
+        print(f"  {'codec':<10} {'on disk':>10} {'ratio':>7} {'write MB/s':>11} {'count MB/s':>11}")
+        for compression, level in settings:
+            label = compression or "plain"
+            if level is not None:
+                label += f"-{level}"
+            path = os.path.join(folder, "app.log" + (CODECS[compression][2] if compression else ""))
+
+            start = time.perf_counter()
+            with open_file(path, "wt", level=level) as file:
+                file.writelines(make_lines(lines))
+            write_time = time.perf_counter() - start
+            size = os.path.getsize(path)
+            plain_size = plain_size or size
+
+            start = time.perf_counter()
+            counted = count_lines(path, workers=1)
+            count_time = time.perf_counter() - start
+            assert counted == lines
+
+            megabytes = plain_size / 1e6                # Throughput in UNCOMPRESSED megabytes
+            print(f"  {label:<10} {size / 1e6:8.1f} MB {plain_size / size:6.1f}x "
+                  f"{megabytes / write_time:11.1f} {megabytes / count_time:11.1f}")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "example.txt.gz")
+        with open_file(path, "wt") as file:                 # ".gz" -> gzip
+            file.write("Hello, World!\nPython is awesome!\nAppended line.")
+
+        plain_copy = os.path.join(folder, "renamed.txt")    # Misleading name, still gzip inside
+        os.replace(path, plain_copy)
+        print(detect_compression(plain_copy))               # Output: gzip
+        print(list(iter_lines(plain_copy)))                 # Output: ['Hello, World!', 'Python is awesome!', 'Appended line.']
+        print(count_lines(plain_copy))                      # Output: 3
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Transparent codecs   | gzip / bz2 / lzma (xz) behind one `open_file()`                          |
+# | Format detection     | magic bytes when reading, file extension when writing                    |
+# | Large buffers        | 1 MiB `BufferedReader` / `BufferedWriter` around the codec stream        |
+# | Same line APIs       | `iter_lines()`, `count_lines()` (plain files use the parallel counter)   |
+# | Trade-off report     | size on disk, ratio, write and count throughput per codec / level        |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,195 @@
+'''
+🔤 Fast Decoder — "Don't Decode What Is Already Text"
+Idea: 10. FileOperation.py shows that open() without an encoding falls back to
+    locale.getpreferredencoding(False), and every text-mode read() decodes bytes -> str.
+
+    Most of our data (logs, CSV exports, ids, numbers) is plain ASCII. An ASCII byte IS its
+    character in UTF-8, Latin-1, cp1252, ... so decoding it only copies memory around.
+
+    FastTextReader:
+        1. detects the encoding ONCE per file (BOM -> ASCII -> UTF-8 -> locale fallback)
+        2. reads big binary blocks
+        3. bytes.isascii() (runs in C) -> hand the block out as a memoryview: no decode, no copy
+        4. any other block goes through an incremental decoder, which also handles a multi-byte
+           character split between two blocks
+
+⚠️ Differences to text mode:
+    1. Blocks are yielded as-is: no "\\r\\n" -> "\\n" translation (like open(..., newline=""))
+    2. A memoryview block holds bytes - use bytes(view).decode("ascii") if you really need a str
+
+💡 Why useful?
+1. The encoding is sniffed once, not guessed per machine
+2. ASCII blocks cost a single isascii() scan
+3. Non-ASCII data is still decoded correctly - only where it occurs
+'''
+
+import codecs
+import locale
+import os
+import tempfile
+import time
+
+BLOCK_SIZE = 1024 * 1024            # 1 MiB per read()
+SAMPLE_SIZE = 64 * 1024             # Bytes looked at by detect_encoding()
+
+BOMS = (                            # Longest first: the UTF-32-LE BOM starts with the UTF-16-LE one
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Encodings where every byte < 0x80 is the ASCII character with the same code
+ASCII_COMPATIBLE = {"ascii", "utf-8", "utf-8-sig", "latin-1", "iso8859-1", "cp1252"}
+
+
+# -------------------------------
+# ENCODING DETECTION
+# -------------------------------
+def detect_encoding(path, sample_size=SAMPLE_SIZE):
+    """Guess a file's encoding from its first bytes: BOM, ASCII, UTF-8, else the locale's default."""
+    with open(path, "rb") as file:
+        sample = file.read(sample_size)
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+    if sample.isascii():
+        return "utf-8"                  # ASCII so far - UTF-8 is the safe superset
+    try:
+        # final=False: a character cut off at the end of the sample is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return locale.getpreferredencoding(False)
+
+
+def _normalize(encoding):
+    return codecs.lookup(encoding).name
+
+
+# -------------------------------
+# FAST READER
+# -------------------------------
+class FastTextReader:
+    """Yields a file's text as memoryviews (ASCII blocks) or str (everything else)."""
+
+    def __init__(self, path, encoding=None, errors="strict", block_size=BLOCK_SIZE):
+        self.path = path
+        self.encoding = _normalize(encoding or detect_encoding(path))
+        self.errors = errors
+        self.block_size = block_size
+        self.fast_blocks = self.decoded_blocks = 0
+
+    def blocks(self):
+        decoder = codecs.getincrementaldecoder(self.encoding)(self.errors)
+        fast_path = self.encoding in ASCII_COMPATIBLE
+        with open(self.path, "rb") as file:
+            if self.encoding == "utf-8-sig":
+                fast_path = file.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8
+                if not fast_path:
+                    file.seek(0)        # No BOM after all - let the decoder see every byte
+            while True:
+                block = file.read(self.block_size)
+                if not block:
+                    break
+                # The decoder must be empty: it may hold the first bytes of a split character
+                if fast_path and block.isascii() and not decoder.getstate()[0]:
+                    self.fast_blocks += 1
+                    yield memoryview(block)
+                else:
+                    self.decoded_blocks += 1
+                    text = decoder.decode(block)
+                    if text:
+                        yield text
+            tail = decoder.decode(b"", final=True)      # Raises on a truncated last character
+            if tail:
+                yield tail
+
+    def __iter__(self):
+        return self.blocks()
+
+    def read(self):
+        """The whole file as one str (decodes the ASCII blocks too)."""
+        return "".join(block if isinstance(block, str) else bytes(block).decode("ascii")
+                       for block in self.blocks())
+
+    def count_chars(self):
+        """Characters in the file - len() of a memoryview block is its byte count = char count."""
+        return sum(len(block) for block in self.blocks())
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def text_mode_chars(path, encoding, block_size=BLOCK_SIZE):
+    """Plain text-mode open(): every block is decoded."""
+    total = 0
+    with open(path, "r", encoding=encoding, newline="") as file:
+        while block := file.read(block_size):
+            total += len(block)
+    return total
+
+
+def make_file(path, size_mb, non_ascii_every=0):
+    """`size_mb` MiB of log lines; every `non_ascii_every`-th MiB gets a line with "₹" in it."""
+    line = "2025-05-14 12:00:00 INFO  payroll run finished for employee 123456\n"
+    block = (line * (1024 * 1024 // len(line))).encode("ascii")
+    special = "2025-05-14 12:00:00 INFO  Bonus paid: ₹5000 to Zoë\n".encode("utf-8")
+    with open(path, "wb") as file:
+        for i in range(size_mb):
+            file.write(block)
+            if non_ascii_every and i % non_ascii_every == 0:
+                file.write(special)
+
+
+def benchmark(size_mb=512):
+    with tempfile.TemporaryDirectory() as folder:
+        for label, every in (("pure ASCII", 0), ("1 MiB in 50 has ₹", 50), ("₹ in every MiB", 1)):
+            path = os.path.join(folder, "data.log")
+            make_file(path, size_mb, every)
+            size_gb = os.path.getsize(path) / 1e9
+
+            start = time.perf_counter()
+            expected = text_mode_chars(path, "utf-8")
+            text_time = time.perf_counter() - start
+
+            reader = FastTextReader(path)
+            start = time.perf_counter()
+            chars = reader.count_chars()
+            fast_time = time.perf_counter() - start
+            assert chars == expected
+
+            print(f"{size_gb:.2f} GB, {label} (detected {reader.encoding}, "
+                  f"{reader.fast_blocks} fast / {reader.decoded_blocks} decoded blocks)")
+            print(f"  text-mode open() : {size_gb / text_time:6.2f} GB/s")
+            print(f"  FastTextReader   : {size_gb / fast_time:6.2f} GB/s")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "example.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("Hello, World!\nPython is awesome!\nPrice: ₹500\n")
+
+        print(locale.getpreferredencoding(False))      # Output: cp1252 (on Windows) - only a guess
+        print(detect_encoding(path))                    # Output: utf-8   - from the data itself
+
+        # Tiny blocks: "₹" (3 bytes) gets split between two blocks and is still decoded correctly
+        reader = FastTextReader(path, block_size=7)
+        print(reader.read() == "Hello, World!\nPython is awesome!\nPrice: ₹500\n")   # Output: True
+        print(reader.fast_blocks, reader.decoded_blocks)                              # Output: 5 2
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Detect once          | BOM check, then `isascii()` / incremental UTF-8 on a 64 KiB sample       |
+# | Zero-copy ASCII      | `bytes.isascii()` -> `memoryview(block)`, no decode                      |
+# | Incremental decoding | `codecs.getincrementaldecoder()` keeps split multi-byte characters       |
+# | Same answer          | `count_chars()` equals `len()` of the text-mode read                     |
+# | Reporting            | GB/s vs text-mode `open()` for pure, mostly and mixed ASCII files        |
+# |______________________|__________________________________________________________________________|
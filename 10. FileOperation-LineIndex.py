@@ -0,0 +1,265 @@
+'''
+🔖 Line-Offset Index + mmap — "Give Me Line N, Instantly"
+Idea: 10. FileOperation.py shows tell() / seek() and warns that in TEXT mode the offsets are not
+    reliable character positions. In BINARY mode they are exact byte positions - and that is all
+    we need to jump straight to any line:
+
+        starts = [0, 15, 34, ...]      # byte offset where every line begins (uint64 array)
+        line N = bytes starts[N] .. starts[N + 1] - 1
+
+    The file itself is opened with mmap (memory map), so reading a line is just slicing memory;
+    the OS loads only the pages we touch.
+
+    Building the index once costs one pass over the file. It is then saved next to the file
+    (<file>.idx), so the next run loads it instead of scanning again. When the log grows by
+    appends, only the NEW bytes are scanned.
+
+Index file layout:
+    | magic 8 bytes | covered u64 | line count u64 | crc32 u32 | crc length u32 | starts: (count + 1) x u64 |
+    covered = byte offset just after the last "\\n" that was indexed
+    crc32   = checksum of the first (up to 4 KiB) bytes, to notice when the file was replaced,
+              not appended to
+
+💡 Why useful?
+1. Line N in O(1): one array lookup + one memory slice
+2. No re-scan on restart - the index is persisted
+3. Appends are indexed incrementally
+'''
+
+import mmap
+import os
+import random
+import struct
+import tempfile
+import time
+import zlib
+
+import numpy as np
+
+INDEX_MAGIC = b"LINEIDX1"
+INDEX_HEADER = struct.Struct("<8sQQII")
+FINGERPRINT_BYTES = 4096
+SCAN_CHUNK = 64 * 1024 * 1024
+
+
+def _newline_starts(buffer, start, end):
+    """Offsets just after every b"\\n" in buffer[start:end] (vectorized, chunk by chunk)."""
+    pieces = []
+    for chunk_start in range(start, end, SCAN_CHUNK):
+        chunk_end = min(chunk_start + SCAN_CHUNK, end)
+        chunk = np.frombuffer(buffer, dtype=np.uint8, count=chunk_end - chunk_start, offset=chunk_start)
+        pieces.append(np.flatnonzero(chunk == 0x0A).astype(np.uint64) + np.uint64(chunk_start + 1))
+    return np.concatenate(pieces) if pieces else np.empty(0, dtype=np.uint64)
+
+
+# -------------------------------
+# INDEXED READER
+# -------------------------------
+class LineIndexedFile:
+    """Random access to the lines of a (possibly huge, append-only) file."""
+
+    def __init__(self, path, index_path=None, encoding="utf-8"):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        self._mm = None
+        self._starts = np.zeros(1, dtype=np.uint64)
+        self._covered = 0
+        self._crc = self._crc_length = 0
+        self._size = 0
+        # False (no file, or a broken one): keep the empty index and rewrite the file in refresh()
+        self._index_saved = self._load_index()
+        self.refresh()
+
+    # ---- mapping ----
+    def _remap(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+
+    def _fingerprint(self, length):
+        return zlib.crc32(self._mm[:length]) if self._mm is not None else 0
+
+    # ---- index persistence ----
+    def _load_index(self):
+        try:
+            with open(self.index_path, "rb") as file:
+                magic, covered, count, crc, crc_length = INDEX_HEADER.unpack(file.read(INDEX_HEADER.size))
+                # Check the header BEFORE trusting its count (garbage could claim 10**18 offsets).
+                # Longer is fine: a crash while appending leaves offsets past the old header's count
+                needed = INDEX_HEADER.size + (count + 1) * 8
+                if magic != INDEX_MAGIC or os.fstat(file.fileno()).st_size < needed:
+                    return False
+                starts = np.fromfile(file, dtype="<u8", count=count + 1)
+        except (FileNotFoundError, struct.error, ValueError):
+            return False
+        if len(starts) != count + 1:
+            return False
+        self._starts, self._covered = starts, covered
+        self._crc, self._crc_length = crc, crc_length
+        return True
+
+    def _header(self):
+        return INDEX_HEADER.pack(INDEX_MAGIC, self._covered, len(self._starts) - 1,
+                                 self._crc, self._crc_length)
+
+    def save_index(self):
+        """Write the whole index (atomically, via a temporary file)."""
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "wb") as file:
+            file.write(self._header())
+            self._starts.astype("<u8").tofile(file)
+        os.replace(tmp, self.index_path)
+
+    def _append_index(self, new_starts):
+        """Add offsets to the end of the saved index, then update its header."""
+        try:
+            file = open(self.index_path, "r+b")
+        except FileNotFoundError:
+            return self.save_index()
+        with file:
+            file.seek(INDEX_HEADER.size + (len(self._starts) - len(new_starts)) * 8)
+            new_starts.astype("<u8").tofile(file)
+            file.truncate()
+            file.flush()
+            file.seek(0)
+            file.write(self._header())      # Header last: a crash before this keeps the old index
+
+    # ---- (re)indexing ----
+    def refresh(self):
+        """Index bytes appended since last time (full rebuild if the file was replaced)."""
+        self._remap()
+        stale = self._size < self._covered or self._fingerprint(self._crc_length) != self._crc
+        if stale:
+            self._starts = np.zeros(1, dtype=np.uint64)
+            self._covered = self._crc = self._crc_length = 0
+
+        new_starts = np.empty(0, dtype=np.uint64)
+        if self._size > self._covered:
+            new_starts = _newline_starts(self._mm, self._covered, self._size)
+        if len(new_starts):
+            self._starts = np.concatenate((self._starts, new_starts))
+            self._covered = int(new_starts[-1])
+        if self._crc_length < FINGERPRINT_BYTES and self._covered > self._crc_length:
+            self._crc_length = min(FINGERPRINT_BYTES, self._covered)
+            self._crc = self._fingerprint(self._crc_length)
+
+        if stale or not self._index_saved or not os.path.exists(self.index_path):
+            self.save_index()               # Appending only works on top of a good saved index
+            self._index_saved = True
+        elif len(new_starts):
+            self._append_index(new_starts)
+
+    # ---- access ----
+    def __len__(self):
+        complete = len(self._starts) - 1
+        return complete + (1 if self._size > self._covered else 0)     # + unterminated last line
+
+    def line_bytes(self, n):
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError("line number out of range")
+        start = int(self._starts[n])
+        end = int(self._starts[n + 1]) - 1 if n + 1 < len(self._starts) else self._size
+        line = self._mm[start:end]
+        return line[:-1] if line.endswith(b"\r") else line
+
+    def __getitem__(self, n):
+        return self.line_bytes(n).decode(self.encoding)
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def naive_line(path, n):
+    """Line N the way 10. FileOperation.py would do it: read lines until we get there."""
+    with open(path, "r", encoding="utf-8") as file:
+        for i, line in enumerate(file):
+            if i == n:
+                return line.rstrip("\r\n")
+
+
+def benchmark(lines=5_000_000, lookups=10_000):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "app.log")
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(f"{i:09d} INFO request served in {i % 997} ms\n" for i in range(lines))
+        size_mb = os.path.getsize(path) / 2**20
+
+        start = time.perf_counter()
+        with LineIndexedFile(path):
+            pass
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reader = LineIndexedFile(path)
+        load_time = time.perf_counter() - start
+
+        rng = random.Random(0)
+        wanted = [rng.randrange(lines) for _ in range(lookups)]
+        start = time.perf_counter()
+        for n in wanted:
+            reader[n]
+        lookup_time = (time.perf_counter() - start) / lookups
+
+        start = time.perf_counter()
+        for n in wanted[:5]:
+            assert naive_line(path, n) == reader[n]
+        naive_time = (time.perf_counter() - start) / 5
+
+        with open(path, "a", encoding="utf-8") as file:
+            file.writelines(f"{i:09d} INFO appended\n" for i in range(lines, lines + 10_000))
+        start = time.perf_counter()
+        reader.refresh()
+        append_time = time.perf_counter() - start
+        assert reader[lines + 9_999] == f"{lines + 9_999:09d} INFO appended"
+        reader.close()
+
+        print(f"{lines:,} lines ({size_mb:,.0f} MiB)")
+        print(f"  build + save index     : {build_time:8.3f} s")
+        print(f"  reopen (load index)    : {load_time * 1000:8.2f} ms")
+        print(f"  random line (index)    : {lookup_time * 1e6:8.2f} µs")
+        print(f"  random line (scan)     : {naive_time * 1000:8.2f} ms")
+        print(f"  refresh after 10K more : {append_time * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "example.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("Hello, World!\nPython is awesome!\nAppended line.")
+
+        with LineIndexedFile(path) as reader:
+            print(len(reader), reader[1])       # Output: 3 Python is awesome!
+
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(" (continued)\nOne more line.\n")
+            reader.refresh()                    # Only the new bytes are scanned
+            print(len(reader), reader[2])       # Output: 4 Appended line. (continued)
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | O(1) line access     | uint64 array of line starts + slicing an `mmap`                          |
+# | Fast build           | NumPy `flatnonzero(chunk == b"\n")` over 64 MiB chunks of the map        |
+# | Persistence          | `<file>.idx` with header + raw offsets, written atomically               |
+# | Incremental refresh  | Only bytes after the last indexed "\n" are scanned; CRC detects rewrites |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,180 @@
+'''
+🧠 Cached Properties — "Compute Once, Reuse Until Something Changes"
+Idea: In 15. GetterSetters.py (and 18. Python-OOP.py) the area is recomputed on EVERY access:
+        rect.area   ->  width * height          (every time)
+        c.area      ->  3.14 * (radius ** 2)    (every time)
+
+    But the setters are the ONLY way width / height / radius can change. So we can:
+        1. compute area the first time it is read and remember it
+        2. forget the remembered value inside the setters - and only there
+
+🛠 A read-only property over a private cache
+    functools.cached_property looks like the obvious tool, but it can be ASSIGNED:
+    `rect.area = 999` would stick, whatever width * height is. So area stays a read-only
+    @property (like in 15. GetterSetters.py) that keeps its result in self._area:
+        None  -> compute it, store it
+        else  -> return it
+    Every setter puts self._area back to None, so the next read recomputes it.
+
+🎯 Precision mode
+    3.14 is fine for teaching, math.pi is what real geometry needs. Circle(r, precise=True)
+    uses math.pi; changing `precise` later also clears the cached area.
+
+💡 Why useful?
+1. Read-heavy code (reports, rendering, sorting by area) stops paying for the maths
+2. The validation in the setters stays exactly as before
+3. The cache can never be stale, because every write path clears it
+'''
+
+import math
+import timeit
+
+
+# -------------------------------
+# RECTANGLE WITH CACHED AREA
+# -------------------------------
+class Rectangle:
+    def __init__(self, width, height):
+        self._area = None               # Cached area (None = not computed yet)
+        self.width = width              # Goes through the setter -> validated
+        self.height = height
+
+    @property
+    def area(self):
+        area = self._area
+        if area is None:
+            area = self._area = self._width * self._height
+        return area
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        if value <= 0:
+            raise ValueError("Width must be positive!")
+        self._width = value
+        self._area = None               # Invalidate the cached area
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        if value <= 0:
+            raise ValueError("Height must be positive!")
+        self._height = value
+        self._area = None
+
+
+# -------------------------------
+# CIRCLE WITH CACHED AREA AND PRECISION MODE
+# -------------------------------
+class Circle:
+    def __init__(self, radius, precise=False):
+        self._area = None
+        self.precise = precise
+        self.radius = radius
+
+    @property
+    def area(self):
+        area = self._area
+        if area is None:
+            pi = math.pi if self._precise else 3.14
+            area = self._area = pi * (self._radius ** 2)   # Same formula as 15. GetterSetters.py
+        return area
+
+    @property
+    def radius(self):
+        return self._radius
+
+    @radius.setter
+    def radius(self, value):
+        if value <= 0:
+            raise ValueError("Radius must be positive!")
+        self._radius = value
+        self._area = None
+
+    @property
+    def precise(self):
+        return self._precise
+
+    @precise.setter
+    def precise(self, value):
+        self._precise = bool(value)
+        self._area = None
+
+
+# -------------------------------
+# MICRO-BENCHMARK: READ-HEAVY WORKLOAD
+# -------------------------------
+class PlainRectangle:
+    """The original version from 15. GetterSetters.py - area recomputed on every read."""
+
+    def __init__(self, width, height):
+        self._width = width
+        self._height = height
+
+    @property
+    def area(self):
+        return self._width * self._height
+
+
+class PlainCircle:
+    def __init__(self, radius):
+        self._radius = radius
+
+    @property
+    def area(self):
+        return 3.14 * (self._radius ** 2)
+
+
+def benchmark(reads=2_000_000):
+    cases = [
+        ("Rectangle", PlainRectangle(5.5, 3.25), Rectangle(5.5, 3.25)),
+        ("Circle", PlainCircle(10.5), Circle(10.5)),
+    ]
+    print(f"{reads:,} reads of .area")
+    for label, plain, cached in cases:
+        plain_time = timeit.timeit("obj.area", globals={"obj": plain}, number=reads)
+        cached_time = timeit.timeit("obj.area", globals={"obj": cached}, number=reads)
+        print(f"  {label:<9}  recomputed: {plain_time:.3f} s   cached: {cached_time:.3f} s"
+              f"   ({plain_time / cached_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    rect = Rectangle(5, 3)
+    print(rect.area)            # Output: 15  (computed)
+    print(rect.area)            # Output: 15  (from the cache)
+    rect.width = 10             # Setter clears the cache
+    print(rect.area)            # Output: 30
+    try:
+        rect.area = 999         # Read-only, like the original property
+    except AttributeError as error:
+        print(error)            # Output: property 'area' of 'Rectangle' object has no setter
+
+    c = Circle(10)
+    print(c.area)               # Output: 314.0
+    c.precise = True            # Switch to math.pi
+    print(c.area)               # Output: 314.1592653589793
+
+    try:
+        rect.height = -2        # Validation still works, cache untouched
+    except ValueError as error:
+        print(error)            # Output: Height must be positive!
+    print(rect.area)            # Output: 30
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Memoized area        | read-only `@property` over a private `_area` (None = not computed)       |
+# | Invalidation         | `width` / `height` / `radius` / `precise` setters reset `_area = None`   |
+# | Precision mode       | `Circle(r, precise=True)` uses `math.pi`, default keeps 3.14             |
+# | Micro-benchmark      | `timeit` of repeated `.area` reads, recomputed vs cached                 |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,293 @@
+'''
+⚙️ Config Registry — "Class-Level Settings Without the Surprises"
+Idea: 17. ClassMethods.py changes a class variable for everybody:
+
+        Employee.company_name = "NextGenSoft"
+
+    and display_info() rebuilds its whole f-string on every call, even when nothing changed.
+    12. InstanceVsClassVariable.py shows the other trap: `d.kind = 'Burfi'` silently creates an
+    INSTANCE variable that hides the class one, so the same attribute means different things
+    on different objects.
+
+    Settings (a registry held by the class):
+        1. every change bumps a version number - but only if the value really changed
+        2. the values dict is REPLACED on change, never modified, so snapshot() just keeps a
+           reference to the current one: O(1), and it never changes afterwards
+        3. Setting() descriptors expose each value as a read-only attribute - assigning it on an
+           instance raises instead of shadowing, and `Employee.company_name = ...` on the class
+           goes through settings.set() (a metaclass) instead of replacing the descriptor
+        4. @cached_per_version("company_name") caches a formatted string and rebuilds it only
+           when one of the settings it depends on (or the object itself) changed
+
+💡 Why useful?
+1. One place to change settings, with a version to tell what changed
+2. Instances can pin a consistent snapshot (e.g. for one long report)
+3. Formatted strings are built once per change, not once per call
+'''
+
+import functools
+import operator
+import timeit
+from types import MappingProxyType
+
+
+# -------------------------------
+# REGISTRY + SNAPSHOTS
+# -------------------------------
+class SettingsSnapshot:
+    """Frozen view of the settings at one version."""
+
+    __slots__ = ("version", "_values", "_versions")
+
+    def __init__(self, version, values, versions):
+        self.version = version
+        self._values = values
+        self._versions = versions
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def version_of(self, *names):
+        return max(self._versions[name] for name in names)
+
+    def as_dict(self):
+        return MappingProxyType(self._values)
+
+    def __repr__(self):
+        return f"SettingsSnapshot(version={self.version}, {dict(self._values)})"
+
+
+class Settings(SettingsSnapshot):
+    """Versioned settings. Changes go through set() / update(); snapshots are free."""
+
+    __slots__ = ("_subscribers",)
+
+    def __init__(self, **values):
+        super().__init__(0, dict(values), dict.fromkeys(values, 0))
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        """callback(name, old, new) after every real change."""
+        self._subscribers.append(callback)
+
+    def set(self, name, value):
+        """Change one setting. Returns False (and keeps the version) if the value is the same."""
+        old = self._values.get(name)
+        if name in self._values and old == value:
+            return False
+        self.version += 1
+        # Copy-on-write: snapshots still hold the old dicts
+        self._values = {**self._values, name: value}
+        self._versions = {**self._versions, name: self.version}
+        for callback in self._subscribers:
+            callback(name, old, value)
+        return True
+
+    def update(self, **values):
+        return [name for name, value in values.items() if self.set(name, value)]
+
+    def snapshot(self):
+        return SettingsSnapshot(self.version, self._values, self._versions)
+
+    def __repr__(self):
+        return f"Settings(version={self.version}, {dict(self._values)})"
+
+
+# -------------------------------
+# CLASS-SIDE HELPERS
+# -------------------------------
+class Setting:
+    """Read-only attribute backed by the class's `settings` (or the instance's snapshot)."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            return (instance._snapshot or owner.settings)._values[self.name]
+        return owner.settings._values[self.name]
+
+    def __set__(self, instance, value):
+        # A data descriptor: `emp.company_name = ...` lands here, not in emp.__dict__
+        raise AttributeError(f"{self.name!r} is a class-level setting, "
+                             f"use {type(instance).__name__}.settings.set({self.name!r}, ...)")
+
+
+class SettingsMeta(type):
+    """Makes `Cls.some_setting = value` mean `Cls.settings.set("some_setting", value)`."""
+
+    def _setting(cls, name):
+        for klass in cls.__mro__:
+            if name in vars(klass):
+                attribute = vars(klass)[name]
+                return attribute if isinstance(attribute, Setting) else None
+        return None
+
+    def __setattr__(cls, name, value):
+        # A plain class assignment would REPLACE the Setting: settings, versions and cached
+        # strings would all keep the old value
+        setting = cls._setting(name)
+        if setting is not None:
+            cls.settings.set(setting.name, value)
+        else:
+            super().__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        if cls._setting(name) is not None:
+            raise AttributeError(f"{name!r} is a class-level setting and can't be deleted")
+        super().__delattr__(name)
+
+
+def cached_per_version(*names):
+    """Cache a method's result until one of the settings `names` or the object changes."""
+    versions_of = operator.itemgetter(*names)      # One name -> an int, several -> a tuple
+
+    def decorator(method):
+        key = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self):
+            version = versions_of((self._snapshot or type(self).settings)._versions)
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            value = method(self)
+            self._cache[key] = (version, value)
+            return value
+        return wrapper
+    return decorator
+
+
+# -------------------------------
+# EMPLOYEE
+# -------------------------------
+class Employee(metaclass=SettingsMeta):
+    settings = Settings(company_name="TechCorp", currency="₹")
+    company_name = Setting()
+
+    def __init__(self, name, age, email):
+        self._cache = {}
+        self._snapshot = None
+        self.name = name
+        self.age = age
+        self.email = email
+
+    def __setattr__(self, name, value):
+        # Any change to the employee itself makes the cached strings stale
+        if not name.startswith("_"):
+            self._cache.clear()
+        object.__setattr__(self, name, value)
+
+    def current_settings(self):
+        return self._snapshot or type(self).settings
+
+    def pin_settings(self):
+        """Keep seeing the settings as they are now (until unpin_settings())."""
+        self._snapshot = type(self).settings.snapshot()
+        self._cache.clear()
+
+    def unpin_settings(self):
+        self._snapshot = None
+        self._cache.clear()
+
+    @classmethod
+    def from_string(cls, emp_string):
+        name, age, email = emp_string.split(",")
+        return cls(name.strip(), int(age.strip()), email.strip())
+
+    @cached_per_version("company_name")
+    def info(self):
+        return f"Name: {self.name}, Age: {self.age}, Email: {self.email}, Company: {self.company_name}"
+
+    def display_info(self):
+        print(self.info())
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+class PlainEmployee:
+    """Employee from 17. ClassMethods.py."""
+    company_name = "TechCorp"
+
+    def __init__(self, name, age, email):
+        self.name = name
+        self.age = age
+        self.email = email
+
+    def info(self):
+        return f"Name: {self.name}, Age: {self.age}, Email: {self.email}, Company: {PlainEmployee.company_name}"
+
+
+def benchmark(number=1_000_000):
+    plain = PlainEmployee("Alice", 30, "alice@techcorp.com")
+    emp = Employee("Alice", 30, "alice@techcorp.com")
+    pinned = Employee("Bob", 28, "bob@techcorp.com")
+    pinned.pin_settings()
+    snapshot = Employee.settings.snapshot()
+
+    cases = [
+        ("plain class variable        ", lambda: plain.company_name),
+        ("Setting() descriptor        ", lambda: emp.company_name),
+        ("Setting() on pinned instance", lambda: pinned.company_name),
+        ("snapshot['company_name']    ", lambda: snapshot["company_name"]),
+        ("plain info() (f-string)     ", plain.info),
+        ("cached info()               ", emp.info),
+    ]
+    print(f"Lookup latency ({number:,} calls each)")
+    for label, call in cases:
+        seconds = min(timeit.repeat(call, number=number, repeat=3))
+        print(f"  {label} : {seconds / number * 1e9:7.1f} ns")
+
+    # Unrelated change: info() stays cached. Related change: rebuilt once.
+    Employee.settings.set("currency", "$")
+    before = emp._cache["info"]
+    emp.info()
+    print("  after currency change, info() rebuilt:", emp._cache["info"] is not before)      # False
+    Employee.settings.set("company_name", "NextGenSoft")
+    emp.info()
+    print("  after company change,  info() rebuilt:", emp._cache["info"] is not before)      # True
+
+
+if __name__ == "__main__":
+    emp1 = Employee("Alice", 30, "alice@techcorp.com")
+    emp3 = Employee.from_string("Charlie, 25, charlie@techcorp.com")
+    emp3.pin_settings()                             # Charlie's report keeps the old settings
+
+    changes = []
+    Employee.settings.subscribe(lambda name, old, new: changes.append((name, old, new)))
+    print(Employee.settings.set("company_name", "NextGenSoft"))    # Output: True
+    print(Employee.settings.set("company_name", "NextGenSoft"))    # Output: False (same value, same version)
+    print(Employee.settings.version, changes)       # Output: 1 [('company_name', 'TechCorp', 'NextGenSoft')]
+
+    emp1.display_info()     # Output: Name: Alice, Age: 30, Email: alice@techcorp.com, Company: NextGenSoft
+    emp3.display_info()     # Output: Name: Charlie, Age: 25, Email: charlie@techcorp.com, Company: TechCorp
+
+    try:
+        emp1.company_name = "Burfi Inc."            # Would shadow the class variable in 12. ...py
+    except AttributeError as error:
+        print(error)        # Output: 'company_name' is a class-level setting, use Employee.settings.set('company_name', ...)
+
+    emp1.age = 31           # The object changed -> cached string is rebuilt
+    emp1.display_info()     # Output: Name: Alice, Age: 31, Email: alice@techcorp.com, Company: NextGenSoft
+
+    Employee.company_name = "Burfi Inc."        # Class assignment = Employee.settings.set(...)
+    print(Employee.settings.version, Employee.settings["company_name"])    # Output: 2 Burfi Inc.
+    emp1.display_info()     # Output: Name: Alice, Age: 31, Email: alice@techcorp.com, Company: Burfi Inc.
+
+    Employee.company_name = "TechCorp"
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Versioned registry   | `Settings.set()` bumps a global + per-setting version on REAL changes    |
+# | Cheap snapshots      | copy-on-write dicts -> `snapshot()` only keeps references                |
+# | No shadowing         | `Setting()` data descriptor raises on instance assignment                |
+# | Class assignment     | `SettingsMeta.__setattr__` routes `Employee.company_name = ...` to set() |
+# | Change propagation   | `settings.subscribe(callback)`                                           |
+# | Per-version caching  | `@cached_per_version(...)` keyed by the versions of its settings         |
+# | Benchmark            | `timeit` ns per lookup: class variable vs descriptor vs snapshot         |
+# |______________________|__________________________________________________________________________|
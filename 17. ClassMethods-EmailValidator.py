@@ -0,0 +1,214 @@
+'''
+📧 Email Validator — "Compile Once, Check Millions"
+Idea: The static method in 17. ClassMethods.py does this on every call:
+
+        pattern = r"^[\w\.-]+@[\w\.-]+\.\w+$"
+        return re.match(pattern, email) is not None
+
+    re.match(pattern, ...) has to look the compiled pattern up in re's internal cache each time
+    (and really compiles it again once that cache is full of other patterns). It also checks
+    ONE address per Python call.
+
+    EmailValidator:
+        1. PATTERNS - a registry of patterns compiled once at import ("basic" = the original one)
+        2. is_valid(email)       - bound compiled .match + an LRU cache for repeated addresses
+        3. validate_many(emails) - a whole column at once: map() over the compiled .match,
+                                   so the loop runs in C
+        4. validate_parallel()   - chunks of a huge input on a process pool
+
+    Results are exactly those of Employee.is_valid_email() - same pattern, same re.match()
+    semantics (including "$" accepting one trailing "\\n").
+
+💡 Why useful?
+1. No per-call pattern lookup
+2. Repeated addresses (the same people email all day) come straight from the cache
+3. Batch and multi-process modes for columns with millions of addresses
+'''
+
+import collections
+import functools
+import itertools
+import operator
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lessons import load_lesson
+
+
+batch_parser = load_lesson("batch_parser")
+BatchParser = batch_parser.BatchParser
+
+# -------------------------------
+# PATTERN REGISTRY
+# -------------------------------
+PATTERNS = {}
+
+
+def register_pattern(name, pattern, flags=0):
+    """Compile `pattern` once and make it available to validators as `name`."""
+    PATTERNS[name] = re.compile(pattern, flags)
+    return PATTERNS[name]
+
+
+register_pattern("basic", r"^[\w\.-]+@[\w\.-]+\.\w+$")                          # 17. ClassMethods.py
+register_pattern("strict", r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}\Z")
+
+
+def _validate_chunk(args):
+    # Runs in a worker process: compile there (re's own cache makes it once per process)
+    pattern, flags, emails = args
+    match = re.compile(pattern, flags).match
+    return list(map(operator.is_not, map(match, emails), itertools.repeat(None)))
+
+
+# -------------------------------
+# VALIDATOR
+# -------------------------------
+class EmailValidator:
+    """Checks addresses against one registered pattern."""
+
+    def __init__(self, pattern="basic", cache_size=100_000):
+        if pattern not in PATTERNS:
+            raise ValueError(f"Unknown pattern {pattern!r}, registered: {list(PATTERNS)}")
+        self.pattern = PATTERNS[pattern]
+        self._match = self.pattern.match
+        # One cache per validator, so two patterns never share results
+        self.is_valid = functools.lru_cache(maxsize=cache_size)(self._check)
+
+    def _check(self, email):
+        return self._match(email) is not None
+
+    def cache_info(self):
+        return self.is_valid.cache_info()
+
+    def validate_many(self, emails):
+        """[True/False per address] - the loop over the column runs in C."""
+        return list(map(operator.is_not, map(self._match, emails), itertools.repeat(None)))
+
+    def invalid(self, emails):
+        """(index, email) of every invalid address."""
+        return [(i, email) for i, (email, ok) in enumerate(zip(emails, self.validate_many(emails))) if not ok]
+
+    def validate_parallel(self, emails, workers=None, chunk_size=250_000):
+        """Like validate_many(), split into chunks over a process pool."""
+        return list(itertools.chain.from_iterable(self.validate_chunks(
+            (emails[i:i + chunk_size] for i in range(0, len(emails), chunk_size)), workers)))
+
+    def validate_chunks(self, chunks, workers=None):
+        """Yield one result list per chunk of addresses (chunks can come from a generator)."""
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            yield from map(self.validate_many, chunks)
+            return
+        # pool.map() would submit EVERY chunk up front - keep only 2 per worker in flight
+        pending = collections.deque()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in chunks:
+                task = (self.pattern.pattern, self.pattern.flags, chunk)
+                pending.append(pool.submit(_validate_chunk, task))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+DEFAULT_VALIDATOR = EmailValidator()
+
+
+class Employee(batch_parser.Employee):
+    @staticmethod
+    def is_valid_email(email):
+        return DEFAULT_VALIDATOR.is_valid(email)
+
+    @classmethod
+    def valid_emails(cls, emails):
+        return DEFAULT_VALIDATOR.validate_many(emails)
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def original_is_valid_email(email):
+    """Employee.is_valid_email() from 17. ClassMethods.py."""
+    pattern = r"^[\w\.-]+@[\w\.-]+\.\w+$"
+    return re.match(pattern, email) is not None
+
+
+def make_emails(start, count, distinct=300_000):
+    """Mostly valid addresses of `distinct` people, every 5th one broken."""
+    return [f"employee{n % distinct}@techcorp.com" if n % 5 else f"employee{n % distinct}.techcorp.com"
+            for n in range(start, start + count)]
+
+
+def benchmark(count=1_000_000, huge=100_000_000, chunk_size=1_000_000):
+    emails = make_emails(0, count)
+    print(f"{count:,} addresses ({count // 5:,} invalid, 300,000 distinct people)")
+
+    start = time.perf_counter()
+    expected = [original_is_valid_email(email) for email in emails]
+    elapsed = time.perf_counter() - start
+    print(f"  re.match() per call       : {count / elapsed:12,.0f} emails/s")
+
+    validator = EmailValidator(cache_size=1 << 20)
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        results = [validator.is_valid(email) for email in emails]
+        elapsed = time.perf_counter() - start
+        assert results == expected
+        print(f"  is_valid(), {label} cache    : {count / elapsed:12,.0f} emails/s"
+              f"  (hits {validator.cache_info().hits:,})")
+
+    start = time.perf_counter()
+    assert validator.validate_many(emails) == expected
+    elapsed = time.perf_counter() - start
+    print(f"  validate_many()           : {count / elapsed:12,.0f} emails/s")
+
+    workers = os.cpu_count() or 1
+    start = time.perf_counter()
+    assert validator.validate_parallel(emails, workers=max(2, workers)) == expected
+    elapsed = time.perf_counter() - start
+    print(f"  validate_parallel({max(2, workers)} proc) : {count / elapsed:12,.0f} emails/s")
+
+    # 100M addresses don't fit in memory as str objects - stream them in 1M chunks.
+    # Only the validation is timed, not building the chunks.
+    validated = valid = 0
+    elapsed = 0.0
+    for chunk_start in range(0, huge, chunk_size):
+        chunk = make_emails(chunk_start, min(chunk_size, huge - chunk_start))
+        start = time.perf_counter()
+        valid += sum(validator.validate_many(chunk))
+        elapsed += time.perf_counter() - start
+        validated += len(chunk)
+    assert valid == validated - validated // 5
+    print(f"{huge:,} addresses, streamed in {chunk_size:,} chunks")
+    print(f"  validate_many()           : {validated / elapsed:12,.0f} emails/s  ({elapsed:.1f} s)")
+
+
+if __name__ == "__main__":
+    print(Employee.is_valid_email("alice@techcorp.com"))    # Output: True
+    print(Employee.is_valid_email("bob.techcorp.com"))      # Output: False
+    print(DEFAULT_VALIDATOR.cache_info().misses)            # Output: 2
+    Employee.is_valid_email("alice@techcorp.com")
+    print(DEFAULT_VALIDATOR.cache_info().hits)              # Output: 1
+
+    # Validate the email column of a parsed batch
+    columns = BatchParser().parse(["Alice, 30, alice@techcorp.com", "Bob, 28, bob.techcorp.com"])
+    print(Employee.valid_emails(columns.emails))            # Output: [True, False]
+    print(EmailValidator("strict").invalid(["ok@a.io", "x@y", "dots@a..io"]))
+    # Output: [(1, 'x@y'), (2, 'dots@a..io')]
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Pattern registry     | `register_pattern()` compiles once into `PATTERNS` ("basic", "strict")   |
+# | Result cache         | `functools.lru_cache` per validator on `is_valid()`                      |
+# | Batch API            | `validate_many()` = `map(is_not, map(pattern.match, emails), None)`      |
+# | Multiprocessing      | `validate_parallel()` / `validate_chunks()` on a `ProcessPoolExecutor`   |
+# | Same answers         | Same pattern and `re.match()` semantics as `Employee.is_valid_email()`   |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,170 @@
+'''
+⚡ asyncio Account Service — "Thousands of Clients, One Thread"
+Idea: BankAccount in 18. Python-OOP.py has no concurrency story. A real bank serves thousands of
+    clients at the same time: balance checks, deposits, and transfers between two accounts.
+
+    asyncio runs many coroutines on one thread. A coroutine only pauses at `await`, so while one
+    client waits (e.g. for storage), others keep working.
+
+    Rules used here:
+        1. every account has its own asyncio.Lock
+        2. deposit / withdraw lock ONE account
+        3. transfer locks BOTH accounts, always in sorted order of the account name
+
+    Why sorted order? If A->B locks A then B while B->A locks B then A, each waits for the
+    other forever (deadlock). With one global order, nobody can hold the "later" lock while
+    waiting for an "earlier" one, so a cycle can't form.
+
+💡 Why useful?
+1. Transfers are atomic - no one ever sees money "in flight"
+2. No deadlocks, however the transfers cross
+3. Different accounts never block each other
+'''
+
+import asyncio
+import random
+import statistics
+import time
+from collections import namedtuple
+
+Result = namedtuple("Result", "ok balance reason")
+
+
+# -------------------------------
+# ACCOUNT SERVICE
+# -------------------------------
+class AccountService:
+    """Async deposit / withdraw / transfer with per-account locks."""
+
+    def __init__(self, io_delay=0.0):
+        self._balances = {}
+        self._locks = {}
+        self.io_delay = io_delay        # Simulated storage latency while a lock is held
+
+    def open_account(self, owner, balance=0):
+        if owner in self._balances:
+            raise KeyError(f"Account {owner!r} already exists!")
+        self._balances[owner] = balance
+        self._locks[owner] = asyncio.Lock()
+
+    async def _persist(self):
+        # Stand-in for writing to a database / log (see 18. Python-OOP-BankWAL.py)
+        await asyncio.sleep(self.io_delay)
+
+    async def get_balance(self, owner):
+        return self._balances[owner]
+
+    async def deposit(self, owner, amount):
+        if amount <= 0:
+            return Result(False, self._balances[owner], "amount must be positive")
+        async with self._locks[owner]:
+            self._balances[owner] += amount
+            await self._persist()
+            return Result(True, self._balances[owner], None)
+
+    async def withdraw(self, owner, amount):
+        async with self._locks[owner]:
+            balance = self._balances[owner]
+            if not 0 < amount <= balance:
+                return Result(False, balance, "insufficient funds")
+            self._balances[owner] = balance - amount
+            await self._persist()
+            return Result(True, self._balances[owner], None)
+
+    async def transfer(self, source, target, amount):
+        if source == target:
+            return Result(False, self._balances[source], "same account")
+        first, second = sorted((source, target))        # Global lock order -> no deadlock
+        async with self._locks[first], self._locks[second]:
+            balance = self._balances[source]
+            if not 0 < amount <= balance:
+                return Result(False, balance, "insufficient funds")
+            self._balances[source] -= amount
+            self._balances[target] += amount
+            await self._persist()
+            return Result(True, self._balances[source], None)
+
+    def total(self):
+        return sum(self._balances.values())
+
+
+# -------------------------------
+# LOAD GENERATOR
+# -------------------------------
+async def _client(service, accounts, operations, latencies, rng):
+    for _ in range(operations):
+        action = rng.random()
+        start = time.perf_counter()
+        if action < 0.5:
+            source, target = rng.sample(accounts, 2)
+            await service.transfer(source, target, rng.randrange(1, 200))
+        elif action < 0.7:
+            await service.deposit(rng.choice(accounts), rng.randrange(1, 200))
+        elif action < 0.9:
+            await service.withdraw(rng.choice(accounts), rng.randrange(1, 200))
+        else:
+            await service.get_balance(rng.choice(accounts))
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_load(concurrency, operations=20_000, accounts=100, io_delay=0.0005):
+    service = AccountService(io_delay)
+    names = [f"acc{i}" for i in range(accounts)]
+    for name in names:
+        service.open_account(name, 10_000)
+
+    latencies = []
+    per_client = max(1, operations // concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(service, names, per_client, latencies, random.Random(seed))
+        for seed in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    # However the operations interleave, no account may ever go negative
+    assert all(balance >= 0 for balance in service._balances.values())
+    cuts = statistics.quantiles(latencies, n=100)
+    return len(latencies) / elapsed, cuts[49], cuts[98]
+
+
+def benchmark():
+    print("100 accounts, 0.5 ms simulated storage latency per change")
+    print("  clients |     ops/s |  p50 (ms) |  p99 (ms)")
+    for concurrency in (1, 10, 100, 1000):
+        ops, p50, p99 = asyncio.run(run_load(concurrency))
+        print(f"  {concurrency:7} | {ops:9,.0f} | {p50 * 1000:9.2f} | {p99 * 1000:9.2f}")
+
+
+async def demo():
+    service = AccountService()
+    service.open_account("Alice", 1000)
+    service.open_account("Bob", 500)
+
+    # Opposite transfers at the same time - would deadlock without the lock order
+    results = await asyncio.gather(
+        service.transfer("Alice", "Bob", 300),
+        service.transfer("Bob", "Alice", 100),
+        service.withdraw("Bob", 5000),
+    )
+    print([r.ok for r in results])                  # Output: [True, True, False]
+    print(await service.get_balance("Alice"),       # Output: 800 700
+          await service.get_balance("Bob"))
+    print(service.total())                          # Output: 1500 (money is never lost)
+
+
+if __name__ == "__main__":
+    asyncio.run(demo())
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Async API            | `async def deposit() / withdraw() / transfer() / get_balance()`          |
+# | Per-account locks    | One `asyncio.Lock` per account                                           |
+# | Atomic transfers     | Both locks held while money moves                                        |
+# | No deadlocks         | Locks always taken in sorted account order                               |
+# | Load generator       | `asyncio.gather` of N clients, p50 / p99 latency per concurrency level   |
+# |______________________|__________________________________________________________________________|
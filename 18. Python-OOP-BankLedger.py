@@ -0,0 +1,219 @@
+'''
+🏦 Batched, Thread-Safe Bank Ledger — "Many Accounts, Many Threads"
+Idea: BankAccount in 18. Python-OOP.py is a great encapsulation example, but as a real system:
+    1. deposit() / withdraw() change __balance with no lock -> two threads can lose an update
+    2. every call handles ONE transaction
+    3. withdraw() prints "Insufficient funds." - the caller can't even tell it failed
+
+    The Ledger keeps all balances in SHARDS. Every shard has its own lock, and an account always
+    lives in the same shard (hash of the account id). A batch of transactions is grouped by shard,
+    so each shard lock is taken ONCE per batch instead of once per transaction.
+
+    Rejections come back as TxResult objects instead of print():
+        TxResult(account='alice', kind='withdraw', amount=5000, ok=False,
+                 balance=1500, reason='insufficient funds')
+
+💡 Why useful?
+1. Threads working on different shards never wait for each other
+2. Fewer lock round-trips per transaction
+3. Structured results are easy to count, log or retry
+'''
+
+import random
+import threading
+import time
+from collections import namedtuple
+
+
+# -------------------------------
+# TRANSACTIONS AND RESULTS
+# -------------------------------
+Tx = namedtuple("Tx", "account kind amount")       # kind: "deposit" or "withdraw"
+TxResult = namedtuple("TxResult", "account kind amount ok balance reason")
+
+
+class _Shard:
+    """A slice of the accounts, protected by one lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.balances = {}
+
+
+# -------------------------------
+# LEDGER ENGINE
+# -------------------------------
+class Ledger:
+    """Sharded balances with batched deposits and withdrawals."""
+
+    def __init__(self, shards=64):
+        self._shards = [_Shard() for _ in range(shards)]
+
+    def _shard_of(self, account):
+        return self._shards[hash(account) % len(self._shards)]
+
+    def open_account(self, account, balance=0):
+        if balance < 0:
+            raise ValueError("Opening balance must be non-negative!")
+        shard = self._shard_of(account)
+        with shard.lock:
+            if account in shard.balances:
+                raise KeyError(f"Account {account!r} already exists!")
+            shard.balances[account] = balance
+
+    def get_balance(self, account):
+        shard = self._shard_of(account)
+        with shard.lock:
+            return shard.balances[account]
+
+    def total_balance(self):
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += sum(shard.balances.values())
+        return total
+
+    @staticmethod
+    def _apply(balances, tx):
+        # Same rules as BankAccount.deposit() / withdraw(), but reported instead of printed
+        balance = balances.get(tx.account)
+        if balance is None:
+            return TxResult(tx.account, tx.kind, tx.amount, False, None, "unknown account")
+        if tx.amount <= 0:
+            return TxResult(tx.account, tx.kind, tx.amount, False, balance, "amount must be positive")
+        if tx.kind == "deposit":
+            balance += tx.amount
+        elif tx.kind == "withdraw":
+            if tx.amount > balance:
+                return TxResult(tx.account, tx.kind, tx.amount, False, balance, "insufficient funds")
+            balance -= tx.amount
+        else:
+            return TxResult(tx.account, tx.kind, tx.amount, False, balance, f"unknown kind {tx.kind!r}")
+        balances[tx.account] = balance
+        return TxResult(tx.account, tx.kind, tx.amount, True, balance, None)
+
+    def apply(self, tx):
+        """Apply a single transaction."""
+        shard = self._shard_of(tx.account)
+        with shard.lock:
+            return self._apply(shard.balances, tx)
+
+    def apply_batch(self, transactions):
+        """Apply many transactions; results come back in the same order.
+
+        Transactions for the same account are applied in the order given.
+        """
+        transactions = list(transactions)
+        count = len(self._shards)
+        by_shard = {}
+        for position, tx in enumerate(transactions):
+            by_shard.setdefault(hash(tx.account) % count, []).append(position)
+
+        results = [None] * len(transactions)
+        for index, positions in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:            # ONE lock round-trip for all of this shard's work
+                balances = shard.balances
+                for position in positions:
+                    results[position] = self._apply(balances, transactions[position])
+        return results
+
+
+# -------------------------------
+# BANKACCOUNT-STYLE HANDLE
+# -------------------------------
+class LedgerAccount:
+    """The familiar deposit / withdraw / get_balance API, backed by a Ledger."""
+
+    def __init__(self, ledger, owner, balance=0):
+        self.owner = owner
+        self._ledger = ledger
+        ledger.open_account(owner, balance)
+
+    def deposit(self, amount):
+        return self._ledger.apply(Tx(self.owner, "deposit", amount))
+
+    def withdraw(self, amount):
+        return self._ledger.apply(Tx(self.owner, "withdraw", amount))   # No print() - check .ok
+
+    def get_balance(self):
+        return self._ledger.get_balance(self.owner)
+
+
+# -------------------------------
+# BENCHMARK: TRANSACTIONS PER SECOND UNDER CONTENTION
+# -------------------------------
+def _producer(ledger, batches, rejected):
+    local_rejected = 0
+    for batch in batches:
+        if len(batch) == 1:
+            results = [ledger.apply(batch[0])]
+        else:
+            results = ledger.apply_batch(batch)
+        local_rejected += sum(not r.ok for r in results)
+    rejected.append(local_rejected)
+
+
+def run_load(shards, batch_size, threads=8, accounts=1_000, per_thread=100_000):
+    ledger = Ledger(shards)
+    names = [f"acc{i}" for i in range(accounts)]
+    for name in names:
+        ledger.open_account(name, 10_000)
+
+    # Generate the work up front so only the ledger is timed
+    work = []
+    for seed in range(threads):
+        rng = random.Random(seed)
+        txs = [Tx(rng.choice(names), rng.choice(("deposit", "withdraw")), rng.randrange(1, 500))
+               for _ in range(per_thread)]
+        work.append([txs[i:i + batch_size] for i in range(0, per_thread, batch_size)])
+
+    rejected = []
+    workers = [threading.Thread(target=_producer, args=(ledger, batches, rejected))
+               for batches in work]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return threads * per_thread / elapsed, sum(rejected)
+
+
+def benchmark():
+    print("8 producer threads, 1,000 accounts, 800,000 transactions")
+    print("  shards | batch |     tx/s | rejected")
+    for shards, batch_size in ((1, 1), (64, 1), (1, 1000), (64, 1000)):
+        tps, rejected = run_load(shards, batch_size)
+        print(f"  {shards:6} | {batch_size:5} | {tps:8,.0f} | {rejected:,}")
+
+
+if __name__ == "__main__":
+    ledger = Ledger()
+    acc = LedgerAccount(ledger, "Alice", 1000)
+    acc.deposit(500)
+    print(acc.get_balance())        # Output: 1500
+
+    result = acc.withdraw(5000)     # No "Insufficient funds." printed...
+    print(result.ok, result.reason) # Output: False insufficient funds
+
+    ledger.open_account("Bob", 0)
+    results = ledger.apply_batch([Tx("Bob", "deposit", 300),
+                                  Tx("Bob", "withdraw", 100),
+                                  Tx("Eve", "deposit", 50)])
+    print([r.ok for r in results])  # Output: [True, True, False]
+    print(ledger.get_balance("Bob"))# Output: 200
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Thread safety        | One `threading.Lock` per shard; an account always maps to one shard      |
+# | Batching             | `apply_batch()` groups by shard and takes each lock once                 |
+# | Structured results   | `TxResult(ok, balance, reason)` instead of print("Insufficient funds.")  |
+# | Familiar API         | `LedgerAccount.deposit()` / `withdraw()` / `get_balance()`               |
+# | Benchmark            | tx/s for 1 vs 64 shards, single vs batched, 8 producer threads           |
+# |______________________|__________________________________________________________________________|
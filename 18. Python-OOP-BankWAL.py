@@ -0,0 +1,388 @@
+'''
+📝 Write-Ahead Log + Snapshots for BankAccount — "Survive a Crash"
+Idea: BankAccount in 18. Python-OOP.py keeps __balance only in memory. If the program dies,
+    every balance is gone and there is no history to replay.
+
+    Write-ahead logging (WAL):
+        1. every successful deposit / withdraw is written to an append-only log file
+        2. the call returns only after the log record is safely on disk (os.fsync)
+        3. after a crash, replaying the log rebuilds every balance
+
+    Group commit:
+        fsync is slow (milliseconds). While one fsync runs, other threads keep adding records.
+        A single background writer then flushes ALL waiting records with ONE fsync, so many
+        deposits/withdrawals share the cost.
+
+    Snapshots:
+        Every `snapshot_every` records the full set of balances is written to snapshot.json and
+        the log is emptied. Restart = load snapshot + replay the (short) log, so recovery time
+        depends on the snapshot size, not on the whole history.
+
+Log line format:   <crc32 hex> [seq, "kind", "account", amount]
+    A crash in the middle of a write leaves a torn last line - its CRC won't match, so
+    recovery stops there and cuts it off.
+    Account owners are strings: snapshot.json keeps the balances as a JSON object.
+
+💡 Why useful?
+1. Balances survive crashes and restarts
+2. Many transactions per fsync instead of one
+3. The BankAccount API (deposit / withdraw / get_balance) stays the same
+'''
+
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+
+WAL_NAME = "wal.log"
+SNAPSHOT_NAME = "snapshot.json"
+
+
+# -------------------------------
+# DURABLE BANK
+# -------------------------------
+class DurableBank:
+    """All account balances, protected by a write-ahead log with group commit."""
+
+    def __init__(self, directory, snapshot_every=100_000, group_commit=True, fsync=True):
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.group_commit = group_commit
+        self.fsync = fsync                      # False = trust the OS cache (fast, not crash-safe)
+        os.makedirs(directory, exist_ok=True)
+
+        self._state_lock = threading.Lock()     # balances + sequence numbers
+        self._io_lock = threading.Lock()        # the log file itself
+        self._snapshot_lock = threading.Lock()
+        self._cond = threading.Condition()      # pending records / durable sequence
+        self._pending = []
+        self._closing = False
+        self._write_error = None                # OSError that stopped the background writer
+        self.fsync_count = 0
+
+        self._balances, self._seq = self._recover()
+        self._durable_balances = dict(self._balances)  # Balances as far as the log is on disk
+        self._snapshot_seq = self._seq
+        self._durable_seq = self._seq
+        self._wal = open(self._path(WAL_NAME), "ab")
+
+        self._writer = None
+        if group_commit:
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    # ---- recovery ----
+    def _recover(self):
+        balances, seq = {}, 0
+        try:
+            with open(self._path(SNAPSHOT_NAME), "r", encoding="utf-8") as file:
+                snapshot = json.load(file)
+            balances, seq = snapshot["balances"], snapshot["seq"]
+        except FileNotFoundError:
+            pass
+
+        try:
+            wal = open(self._path(WAL_NAME), "r+b")
+        except FileNotFoundError:
+            return balances, seq
+        with wal:
+            good_end = 0
+            for line in wal:
+                crc, _, payload = line.rstrip(b"\n").partition(b" ")
+                try:
+                    if not line.endswith(b"\n") or int(crc, 16) != zlib.crc32(payload):
+                        break
+                    record_seq, kind, account, amount = json.loads(payload)
+                except (TypeError, ValueError):
+                    break                       # Torn / corrupt tail - stop here
+                good_end += len(line)
+                if record_seq <= seq:
+                    continue                    # Already inside the snapshot
+                self._redo(balances, kind, account, amount)
+                seq = record_seq
+            wal.truncate(good_end)
+        return balances, seq
+
+    @staticmethod
+    def _redo(balances, kind, account, amount):
+        if kind == "open":
+            balances[account] = amount
+        elif kind == "deposit":
+            balances[account] += amount
+        elif kind == "withdraw":
+            balances[account] -= amount
+
+    # ---- logging ----
+    @staticmethod
+    def _encode(seq, kind, account, amount):
+        payload = json.dumps([seq, kind, account, amount]).encode("utf-8")
+        return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+    def _write_and_sync(self, data):
+        with self._io_lock:
+            self._wal.write(data)
+            self._wal.flush()
+            if self.fsync:
+                os.fsync(self._wal.fileno())
+                self.fsync_count += 1
+
+    def _writer_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+            try:
+                self._write_and_sync(b"".join(record for _, record, _ in batch))   # ONE fsync per group
+            except OSError as error:
+                # Disk full, I/O error... - nothing after this can be made durable. Wake every
+                # waiter with the error instead of leaving them blocked forever.
+                with self._cond:
+                    self._write_error = error
+                    self._cond.notify_all()
+                return
+            for _, _, operation in batch:
+                self._redo(self._durable_balances, *operation)
+            with self._cond:
+                self._durable_seq = batch[-1][0]
+                self._cond.notify_all()
+
+    def _log(self, kind, account, amount):
+        """Called with _state_lock held: log the change, THEN apply it to the balances.
+
+        Raises (and changes nothing) if the bank is closed or the log can't be written.
+        """
+        with self._cond:
+            if self._closing:
+                raise ValueError("The bank is closed!")
+            if self._write_error is not None:
+                raise OSError("Write-ahead log failed earlier, no new transactions!") \
+                    from self._write_error
+            self._seq += 1
+            record = self._encode(self._seq, kind, account, amount)
+            if self.group_commit:
+                # The balances change now (later transactions must see them), but the writer
+                # keeps _durable_balances - what to fall back to if this record never hits disk
+                self._pending.append((self._seq, record, (kind, account, amount)))
+                self._cond.notify_all()
+        if not self.group_commit:
+            try:
+                self._write_and_sync(record)    # One fsync per transaction
+            except BaseException:
+                self._seq -= 1
+                raise
+            self._durable_seq = self._seq
+        self._redo(self._balances, kind, account, amount)
+        return self._seq
+
+    def _wait_written(self, seq):
+        with self._cond:
+            while self._durable_seq < seq:
+                if self._write_error is not None:
+                    raise OSError(f"Write-ahead log failed, record {seq} is not durable!") \
+                        from self._write_error
+                self._cond.wait()
+
+    def _roll_back(self):
+        """Called with _state_lock held after a write error: forget what never reached the disk."""
+        self._balances = dict(self._durable_balances)
+        self._seq = self._durable_seq
+
+    def _wait_durable(self, seq):
+        if self.group_commit:
+            try:
+                self._wait_written(seq)
+            except OSError:
+                with self._state_lock:
+                    self._roll_back()
+                raise
+        if seq - self._snapshot_seq >= self.snapshot_every:
+            self.snapshot()
+
+    # ---- public API ----
+    def open_account(self, owner, balance=0):
+        if not isinstance(owner, str):
+            # snapshot.json stores balances as a JSON object: 42 would come back as "42"
+            raise TypeError(f"Account owners must be strings, got {owner!r}")
+        with self._state_lock:
+            if owner in self._balances:
+                raise KeyError(f"Account {owner!r} already exists!")
+            seq = self._log("open", owner, balance)
+        self._wait_durable(seq)
+
+    def deposit(self, owner, amount):
+        if amount > 0:                          # Same rule as BankAccount.deposit()
+            with self._state_lock:
+                if owner not in self._balances:
+                    raise KeyError(owner)
+                seq = self._log("deposit", owner, amount)
+            self._wait_durable(seq)
+
+    def withdraw(self, owner, amount):
+        with self._state_lock:
+            if 0 < amount <= self._balances[owner]:
+                seq = self._log("withdraw", owner, amount)
+            else:
+                seq = None
+        if seq is None:
+            print("Insufficient funds.")        # Same behaviour as BankAccount.withdraw()
+            return
+        self._wait_durable(seq)
+
+    def get_balance(self, owner):
+        with self._state_lock:
+            return self._balances[owner]
+
+    def snapshot(self):
+        """Write all balances to snapshot.json and empty the log."""
+        with self._snapshot_lock, self._state_lock:     # No new transactions meanwhile
+            seq = self._seq
+            if seq == self._snapshot_seq:
+                return                          # Another thread just took this snapshot
+            if self.group_commit:
+                try:
+                    self._wait_written(seq)
+                except OSError:
+                    self._roll_back()
+                    raise
+            with self._io_lock:
+                tmp = self._path(SNAPSHOT_NAME + ".tmp")
+                with open(tmp, "w", encoding="utf-8") as file:
+                    json.dump({"seq": seq, "balances": self._balances}, file)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp, self._path(SNAPSHOT_NAME))    # Atomic switch to the new snapshot
+                # The rename itself must be on disk before the log is emptied
+                self._fsync_directory()
+                # A crash right here is fine: old log records have seq <= snapshot seq
+                self._wal.truncate(0)
+                self._wal.seek(0)
+            self._snapshot_seq = seq
+
+    def _fsync_directory(self):
+        if not self.fsync or os.name == "nt":   # Windows can't open (or fsync) a directory
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self):
+        with self._cond:
+            self._closing = True                # New transactions now raise instead of waiting
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+        self._wal.close()
+
+
+# -------------------------------
+# BANKACCOUNT-STYLE HANDLE
+# -------------------------------
+class DurableBankAccount:
+    """Same methods as BankAccount, but every change goes through the write-ahead log."""
+
+    def __init__(self, bank, owner, balance=0):
+        self.owner = owner
+        self._bank = bank
+        try:
+            bank.get_balance(owner)             # Recovered account - keep its balance
+        except KeyError:
+            bank.open_account(owner, balance)
+
+    def deposit(self, amount):
+        self._bank.deposit(self.owner, amount)
+
+    def withdraw(self, amount):
+        self._bank.withdraw(self.owner, amount)
+
+    def get_balance(self):
+        return self._bank.get_balance(self.owner)
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def _depositor(bank, owner, count):
+    for _ in range(count):
+        bank.deposit(owner, 1)
+
+
+def benchmark(threads=16, per_thread=500):
+    print(f"{threads} threads x {per_thread} deposits")
+    for group_commit in (False, True):
+        with tempfile.TemporaryDirectory() as folder:
+            bank = DurableBank(folder, group_commit=group_commit)
+            for i in range(threads):
+                bank.open_account(f"acc{i}", 0)
+            fsyncs_before = bank.fsync_count
+
+            workers = [threading.Thread(target=_depositor, args=(bank, f"acc{i}", per_thread))
+                       for i in range(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+            fsyncs = bank.fsync_count - fsyncs_before
+            bank.close()
+
+            label = "group commit  " if group_commit else "fsync per tx  "
+            total = threads * per_thread
+            print(f"  {label}: {total / elapsed:8,.0f} tx/s, {fsyncs:,} fsyncs ({total / fsyncs:.1f} tx per fsync)")
+
+    # Recovery: same history, with and without a snapshot
+    history = 200_000
+    for snapshot_every in (10**9, 10_000):
+        with tempfile.TemporaryDirectory() as folder:
+            # fsync=False only to build the history quickly
+            bank = DurableBank(folder, snapshot_every=snapshot_every, group_commit=False, fsync=False)
+            bank.open_account("Alice", 0)
+            for _ in range(history):
+                bank.deposit("Alice", 1)
+            bank.close()
+
+            start = time.perf_counter()
+            bank = DurableBank(folder, group_commit=False)
+            elapsed = time.perf_counter() - start
+            assert bank.get_balance("Alice") == history
+            bank.close()
+            label = "log only      " if snapshot_every > history else "with snapshots"
+            print(f"  recovery {label}: {elapsed * 1000:8.1f} ms for {history:,} transactions of history")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        bank = DurableBank(folder)
+        acc = DurableBankAccount(bank, "Alice", 1000)
+        acc.deposit(500)
+        acc.withdraw(5000)                  # Output: Insufficient funds.
+        bank.close()                        # ... pretend the program crashed here
+
+        bank = DurableBank(folder)          # Restart: replay the log
+        acc = DurableBankAccount(bank, "Alice")
+        print(acc.get_balance())            # Output: 1500
+        bank.close()
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Write-ahead log      | Append-only `wal.log`, CRC32 per line, torn tail cut off on recovery     |
+# | Write failures       | `OSError` raised in every waiting caller, balances rolled back to disk   |
+# | Group commit         | Background writer flushes all waiting records with one `os.fsync`        |
+# | Snapshots            | `snapshot.json` written atomically (`os.replace`), then the log is reset |
+# | Same API             | `DurableBankAccount.deposit()` / `withdraw()` / `get_balance()`          |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,198 @@
+'''
+🔷 Vectorized Shapes — "Tens of Millions of Areas at Once"
+Idea: In 18. Python-OOP.py every Circle / Rectangle computes its own area() through the Shape ABC.
+    That is abstraction at its best, but for tens of millions of geometry records the time goes
+    into method calls, not into the maths.
+
+    ShapeArray keeps the same shapes as typed NumPy columns:
+        kind -> uint8   (0 = Circle, 1 = Rectangle)
+        a    -> float64 (radius for circles, width for rectangles)
+        b    -> float64 (0 for circles, height for rectangles)
+
+    and computes every area with ONE vectorized expression:
+        where(kind == Circle, 3.14 * a * a, a * b)
+
+💡 Why useful?
+1. Same numbers as Circle.area() / Rectangle.area() (same formula, same order of operations)
+2. Totals and per-type histograms without a Python loop
+3. Converts back to Circle / Rectangle objects whenever you need the OOP view
+'''
+
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+# -------------------------------
+# THE SHAPES (same classes as in 18. Python-OOP.py)
+# -------------------------------
+class Shape(ABC):
+    @abstractmethod
+    def area(self):
+        pass
+
+
+class Circle(Shape):
+    def __init__(self, radius):
+        self.radius = radius
+
+    def area(self):
+        return 3.14 * self.radius * self.radius
+
+
+class Rectangle(Shape):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+
+# -------------------------------
+# KIND CODES
+# -------------------------------
+CIRCLE = 0
+RECTANGLE = 1
+KIND_NAMES = {CIRCLE: "Circle", RECTANGLE: "Rectangle"}
+
+
+# -------------------------------
+# SHAPE ARRAY
+# -------------------------------
+class ShapeArray:
+    """Circles and rectangles stored column by column."""
+
+    def __init__(self, kinds, a, b):
+        self.kinds = np.asarray(kinds, dtype=np.uint8)
+        self.a = np.asarray(a, dtype=np.float64)
+        self.b = np.asarray(b, dtype=np.float64)
+        if not (self.kinds.shape == self.a.shape == self.b.shape) or self.kinds.ndim != 1:
+            raise ValueError("kinds, a and b must be 1-D and the same length!")
+        if not np.isin(self.kinds, list(KIND_NAMES)).all():
+            raise ValueError("Unknown shape kind!")
+
+    def __len__(self):
+        return len(self.kinds)
+
+    # Alternative constructors
+    @classmethod
+    def from_shapes(cls, shapes):
+        shapes = list(shapes)
+        kinds = np.empty(len(shapes), dtype=np.uint8)
+        a = np.empty(len(shapes))
+        b = np.zeros(len(shapes))
+        for i, shape in enumerate(shapes):
+            if isinstance(shape, Circle):
+                kinds[i], a[i] = CIRCLE, shape.radius
+            elif isinstance(shape, Rectangle):
+                kinds[i], a[i], b[i] = RECTANGLE, shape.width, shape.height
+            else:
+                raise TypeError(f"Unsupported shape: {type(shape).__name__}")
+        return cls(kinds, a, b)
+
+    @classmethod
+    def circles(cls, radii):
+        radii = np.asarray(radii, dtype=np.float64)
+        return cls(np.full(len(radii), CIRCLE, dtype=np.uint8), radii, np.zeros(len(radii)))
+
+    @classmethod
+    def rectangles(cls, widths, heights):
+        widths = np.asarray(widths, dtype=np.float64)
+        return cls(np.full(len(widths), RECTANGLE, dtype=np.uint8), widths, heights)
+
+    @classmethod
+    def concat(cls, arrays):
+        arrays = list(arrays)
+        return cls(np.concatenate([s.kinds for s in arrays]),
+                   np.concatenate([s.a for s in arrays]),
+                   np.concatenate([s.b for s in arrays]))
+
+    # ---- vectorized maths ----
+    def areas(self):
+        # Same expressions as Circle.area() and Rectangle.area()
+        return np.where(self.kinds == CIRCLE, 3.14 * self.a * self.a, self.a * self.b)
+
+    def total_area(self):
+        return float(self.areas().sum())
+
+    def totals_by_kind(self):
+        sums = np.bincount(self.kinds, weights=self.areas(), minlength=len(KIND_NAMES))
+        counts = np.bincount(self.kinds, minlength=len(KIND_NAMES))
+        return {KIND_NAMES[k]: {"count": int(counts[k]), "area": float(sums[k])} for k in KIND_NAMES}
+
+    def histograms(self, bins=10):
+        """Area histogram per shape type, all on the same bin edges."""
+        areas = self.areas()
+        edges = np.histogram_bin_edges(areas, bins=bins)
+        return edges, {KIND_NAMES[k]: np.histogram(areas[self.kinds == k], bins=edges)[0]
+                       for k in KIND_NAMES}
+
+    # ---- back to objects ----
+    def shape_at(self, i):
+        if self.kinds[i] == CIRCLE:
+            return Circle(float(self.a[i]))
+        return Rectangle(float(self.a[i]), float(self.b[i]))
+
+    def to_shapes(self):
+        return [self.shape_at(i) for i in range(len(self))]
+
+
+# -------------------------------
+# BENCHMARK: area() PER OBJECT vs ShapeArray
+# -------------------------------
+def random_shapes(n, seed=0):
+    rng = np.random.default_rng(seed)
+    kinds = rng.integers(0, 2, n, dtype=np.uint8)
+    a = rng.uniform(0.1, 100.0, n)
+    b = np.where(kinds == RECTANGLE, rng.uniform(0.1, 100.0, n), 0.0)
+    return ShapeArray(kinds, a, b)
+
+
+def benchmark(n=10_000_000, object_sample=1_000_000):
+    shapes = random_shapes(n)
+
+    start = time.perf_counter()
+    areas = shapes.areas()
+    total = areas.sum()
+    vector_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    shapes.histograms()
+    histogram_time = time.perf_counter() - start
+
+    # Objects for a 1M sample only - 10M objects would need several GB of RAM
+    sample = ShapeArray(shapes.kinds[:object_sample], shapes.a[:object_sample], shapes.b[:object_sample])
+    objects = sample.to_shapes()
+    start = time.perf_counter()
+    object_areas = [shape.area() for shape in objects]
+    object_time = time.perf_counter() - start
+
+    assert np.array_equal(np.array(object_areas), areas[:object_sample])
+    per_object = object_time / object_sample
+    print(f"{n:,} shapes, total area {total:,.0f}")
+    print(f"  area() per object  : {per_object * n:6.2f} s (extrapolated from {object_sample:,})")
+    print(f"  ShapeArray areas   : {vector_time:6.2f} s")
+    print(f"  ShapeArray hist    : {histogram_time:6.2f} s (10 bins per type)")
+
+
+if __name__ == "__main__":
+    shapes = ShapeArray.from_shapes([Circle(5), Rectangle(4, 6)])
+    print(shapes.areas())               # Output: [78.5 24. ]
+    print(shapes.totals_by_kind())
+    # Output: {'Circle': {'count': 1, 'area': 78.5}, 'Rectangle': {'count': 1, 'area': 24.0}}
+    print(shapes.to_shapes()[0].area()) # Output: 78.5
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Typed columns        | kind (uint8), a / b (float64)                                            |
+# | Vectorized areas     | `np.where(kind == CIRCLE, 3.14 * a * a, a * b)`                          |
+# | Totals / histograms  | `np.bincount` per kind, `np.histogram` on shared bin edges               |
+# | Round trip           | `from_shapes()` / `to_shapes()` with the Shape ABC classes               |
+# |______________________|__________________________________________________________________________|
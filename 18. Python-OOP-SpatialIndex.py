@@ -0,0 +1,275 @@
+'''
+🗺️ Spatial Index for Shapes — "Which Shapes Are Near Here?"
+Idea: Circle and Rectangle in 18. Python-OOP.py only know their size. Once shapes have positions
+    and there are millions of them, "which shapes overlap this region?" means checking every
+    single shape - a full scan for every question.
+
+    This lesson:
+        1. gives shapes a position (PlacedCircle: centre x, y / PlacedRectangle: lower-left x, y)
+        2. stores them as columns (ShapeArray from 18. Python-OOP-ShapeArray.py + x / y columns)
+        3. builds a UNIFORM GRID index:
+             - the plane is cut into equal cells
+             - each shape is listed in every cell its bounding box touches
+             - a query only looks at the shapes listed in the cells it touches
+
+    Grid layout (CSR - "compressed sparse rows"):
+        cell_start[c] .. cell_start[c + 1]  ->  positions in `entries` holding the shape IDs of cell c
+
+💡 Why useful?
+1. Range queries touch a handful of cells instead of every shape
+2. Nearest neighbour searches outward ring by ring and stops early
+3. Bulk load is fully vectorized (no Python loop over shapes)
+'''
+
+import math
+import time
+
+import numpy as np
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# LOAD THE SHAPE ARRAY LESSON
+# -------------------------------
+shape_array = load_lesson("shape_array")
+ShapeArray = shape_array.ShapeArray
+CIRCLE = shape_array.CIRCLE
+
+
+# -------------------------------
+# SHAPES WITH A POSITION
+# -------------------------------
+class PlacedCircle(shape_array.Circle):
+    def __init__(self, x, y, radius):
+        super().__init__(radius)
+        self.x, self.y = x, y           # Centre
+
+
+class PlacedRectangle(shape_array.Rectangle):
+    def __init__(self, x, y, width, height):
+        super().__init__(width, height)
+        self.x, self.y = x, y           # Lower-left corner
+
+
+class PlacedShapes:
+    """A ShapeArray plus x / y columns and precomputed bounding boxes."""
+
+    def __init__(self, shapes, x, y):
+        self.shapes = shapes
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        circle = shapes.kinds == CIRCLE
+        self.is_circle = circle
+        # Bounding boxes: circles around the centre, rectangles from the corner
+        self.xmin = np.where(circle, self.x - shapes.a, self.x)
+        self.xmax = np.where(circle, self.x + shapes.a, self.x + shapes.a)
+        self.ymin = np.where(circle, self.y - shapes.a, self.y)
+        self.ymax = np.where(circle, self.y + shapes.a, self.y + shapes.b)
+
+    def __len__(self):
+        return len(self.shapes)
+
+    @classmethod
+    def from_shapes(cls, placed):
+        placed = list(placed)
+        return cls(ShapeArray.from_shapes(placed), [s.x for s in placed], [s.y for s in placed])
+
+    def shape_at(self, i):
+        if self.is_circle[i]:
+            return PlacedCircle(float(self.x[i]), float(self.y[i]), float(self.shapes.a[i]))
+        return PlacedRectangle(float(self.x[i]), float(self.y[i]),
+                               float(self.shapes.a[i]), float(self.shapes.b[i]))
+
+    # ---- exact geometry on a set of IDs ----
+    def overlaps(self, ids, x0, y0, x1, y1):
+        """Mask of shapes (by ID) that really intersect the box [x0, x1] x [y0, y1]."""
+        box = ((self.xmin[ids] <= x1) & (self.xmax[ids] >= x0) &
+               (self.ymin[ids] <= y1) & (self.ymax[ids] >= y0))
+        # A circle touches the box if the closest box point is within the radius
+        cx, cy, r = self.x[ids], self.y[ids], self.shapes.a[ids]
+        dx = np.clip(cx, x0, x1) - cx
+        dy = np.clip(cy, y0, y1) - cy
+        return box & (~self.is_circle[ids] | (dx * dx + dy * dy <= r * r))
+
+    def distances(self, ids, px, py):
+        """Distance from the point to each shape (0 if the point is inside)."""
+        circle = np.maximum(np.hypot(self.x[ids] - px, self.y[ids] - py) - self.shapes.a[ids], 0.0)
+        dx = np.maximum(np.maximum(self.xmin[ids] - px, px - self.xmax[ids]), 0.0)
+        dy = np.maximum(np.maximum(self.ymin[ids] - py, py - self.ymax[ids]), 0.0)
+        return np.where(self.is_circle[ids], circle, np.hypot(dx, dy))
+
+
+# -------------------------------
+# UNIFORM GRID INDEX
+# -------------------------------
+class GridIndex:
+    """Uniform grid over PlacedShapes with range and nearest-neighbour queries."""
+
+    def __init__(self, placed, shapes_per_cell=8):
+        self.placed = placed
+        n = len(placed)
+        self.x0, self.y0 = float(placed.xmin.min()), float(placed.ymin.min())
+        width = max(float(placed.xmax.max()) - self.x0, 1e-9)
+        height = max(float(placed.ymax.max()) - self.y0, 1e-9)
+
+        # Aim for ~shapes_per_cell shapes per cell, but never cells smaller than typical shapes
+        typical = float(np.percentile(np.maximum(placed.xmax - placed.xmin,
+                                                 placed.ymax - placed.ymin), 90))
+        cell = max(math.sqrt(width * height * shapes_per_cell / max(n, 1)), typical, 1e-9)
+        self.nx = max(1, min(int(width / cell) + 1, 1 << 15))
+        self.ny = max(1, min(int(height / cell) + 1, 1 << 15))
+        self.cw, self.ch = width / self.nx, height / self.ny
+
+        self._bulk_load()
+
+    def _cell_x(self, x):
+        return np.clip(((np.asarray(x) - self.x0) / self.cw).astype(np.int64), 0, self.nx - 1)
+
+    def _cell_y(self, y):
+        return np.clip(((np.asarray(y) - self.y0) / self.ch).astype(np.int64), 0, self.ny - 1)
+
+    def _bulk_load(self):
+        p = self.placed
+        ix0, ix1 = self._cell_x(p.xmin), self._cell_x(p.xmax)
+        iy0, iy1 = self._cell_y(p.ymin), self._cell_y(p.ymax)
+        wide = ix1 - ix0 + 1
+        per_shape = wide * (iy1 - iy0 + 1)             # cells touched by each shape
+
+        # One entry per (shape, cell) pair - expanded without a Python loop
+        ids = np.repeat(np.arange(len(p), dtype=np.int32), per_shape)
+        first = np.repeat(np.cumsum(per_shape) - per_shape, per_shape)
+        local = np.arange(len(ids), dtype=np.int64) - first
+        cells = ((np.repeat(iy0, per_shape) + local // np.repeat(wide, per_shape)) * self.nx
+                 + np.repeat(ix0, per_shape) + local % np.repeat(wide, per_shape))
+
+        order = np.argsort(cells, kind="stable")
+        self.entries = ids[order]
+        counts = np.bincount(cells, minlength=self.nx * self.ny)
+        self.cell_start = np.concatenate(([0], np.cumsum(counts)))
+
+    def _ids_in_cells(self, cells):
+        starts, ends = self.cell_start[cells], self.cell_start[cells + 1]
+        if len(cells) == 1:
+            return self.entries[starts[0]:ends[0]]
+        return np.unique(np.concatenate([self.entries[s:e] for s, e in zip(starts, ends)]))
+
+    def range_query(self, x0, y0, x1, y1):
+        """IDs of all shapes that intersect the box [x0, x1] x [y0, y1]."""
+        cx = np.arange(self._cell_x(x0), self._cell_x(x1) + 1)
+        cy = np.arange(self._cell_y(y0), self._cell_y(y1) + 1)
+        cells = (cy[:, None] * self.nx + cx[None, :]).ravel()
+        candidates = self._ids_in_cells(cells)
+        return np.sort(candidates[self.placed.overlaps(candidates, x0, y0, x1, y1)])
+
+    def nearest(self, px, py):
+        """(ID, distance) of the shape closest to the point."""
+        cx, cy = int(self._cell_x(px)), int(self._cell_y(py))
+        best_id, best = -1, math.inf
+        ring = 0
+        while True:
+            # Cells exactly `ring` steps away from (cx, cy)
+            xs = np.arange(max(cx - ring, 0), min(cx + ring, self.nx - 1) + 1)
+            ys = np.arange(max(cy - ring, 0), min(cy + ring, self.ny - 1) + 1)
+            gx, gy = np.meshgrid(xs, ys)
+            on_ring = np.maximum(np.abs(gx - cx), np.abs(gy - cy)) == ring
+            cells = (gy[on_ring] * self.nx + gx[on_ring]).ravel()
+            if len(cells):
+                candidates = self._ids_in_cells(cells)
+                if len(candidates):
+                    dist = self.placed.distances(candidates, px, py)
+                    k = int(np.argmin(dist))
+                    if dist[k] < best:
+                        best_id, best = int(candidates[k]), float(dist[k])
+            # Anything not seen yet lives at least `ring` whole cells away
+            if best <= ring * min(self.cw, self.ch):
+                return best_id, best
+            if ring > max(self.nx, self.ny):
+                return best_id, best
+            ring += 1
+
+
+# -------------------------------
+# LINEAR SCAN (for comparison)
+# -------------------------------
+def scan_range(placed, x0, y0, x1, y1):
+    everyone = np.arange(len(placed))
+    return everyone[placed.overlaps(everyone, x0, y0, x1, y1)]
+
+
+def scan_nearest(placed, px, py):
+    dist = placed.distances(np.arange(len(placed)), px, py)
+    k = int(np.argmin(dist))
+    return k, float(dist[k])
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def random_placed(n, seed=0):
+    rng = np.random.default_rng(seed)
+    side = math.sqrt(n) * 10.0                      # keep density the same at every size
+    kinds = rng.integers(0, 2, n, dtype=np.uint8)
+    a = rng.uniform(0.5, 3.0, n)
+    b = np.where(kinds == CIRCLE, 0.0, rng.uniform(0.5, 3.0, n))
+    return PlacedShapes(ShapeArray(kinds, a, b), rng.uniform(0, side, n), rng.uniform(0, side, n)), side
+
+
+def benchmark(sizes=(10_000, 1_000_000, 10_000_000), queries=100):
+    print("  shapes     | build (s) | range: scan / grid (ms) | nearest: scan / grid (ms)")
+    for n in sizes:
+        placed, side = random_placed(n)
+        rng = np.random.default_rng(1)
+        boxes = [(x, y, x + 50, y + 50) for x, y in rng.uniform(0, side - 50, (queries, 2))]
+        points = rng.uniform(0, side, (queries, 2))
+
+        start = time.perf_counter()
+        index = GridIndex(placed)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = [scan_range(placed, *box) for box in boxes]
+        range_scan = (time.perf_counter() - start) / queries
+        start = time.perf_counter()
+        found = [index.range_query(*box) for box in boxes]
+        range_grid = (time.perf_counter() - start) / queries
+        assert all(np.array_equal(a, b) for a, b in zip(scanned, found))
+
+        start = time.perf_counter()
+        near_scanned = [scan_nearest(placed, px, py) for px, py in points]
+        near_scan = (time.perf_counter() - start) / queries
+        start = time.perf_counter()
+        near_found = [index.nearest(px, py) for px, py in points]
+        near_grid = (time.perf_counter() - start) / queries
+        assert all(math.isclose(a[1], b[1]) for a, b in zip(near_scanned, near_found))
+
+        print(f"  {n:>10,} | {build:9.2f} | {range_scan * 1000:10.3f} / {range_grid * 1000:8.3f} |"
+              f" {near_scan * 1000:11.3f} / {near_grid * 1000:8.3f}")
+        del index, placed
+
+
+if __name__ == "__main__":
+    placed = PlacedShapes.from_shapes([
+        PlacedCircle(0, 0, 5),
+        PlacedRectangle(10, 10, 4, 6),
+        PlacedCircle(100, 100, 1),
+    ])
+    index = GridIndex(placed)
+    print(index.range_query(3, 3, 12, 12))     # Output: [0 1]  (circle edge + rectangle corner)
+    print(index.range_query(4, 4, 9, 9))       # Output: []     (inside the circle's box, not the circle)
+    shape_id, distance = index.nearest(95, 100)
+    print(type(placed.shape_at(shape_id)).__name__, distance)   # Output: PlacedCircle 4.0
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Positions            | `PlacedCircle` / `PlacedRectangle`, x / y columns next to a ShapeArray   |
+# | Bulk load            | Vectorized (shape, cell) expansion + argsort into CSR cell lists         |
+# | Range query          | Cells touched by the box, then exact circle / rectangle overlap test     |
+# | Nearest neighbour    | Ring-by-ring search with an early stop                                   |
+# | Benchmark            | Grid vs vectorized linear scan at 10K, 1M and 10M shapes                 |
+# |______________________|__________________________________________________________________________|
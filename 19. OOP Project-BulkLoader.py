@@ -0,0 +1,239 @@
+'''
+📥 Bulk Payroll Loader — "Millions of Rows Without input()"
+Idea: main() in 19. OOP Project-EmployeeSalary.py adds employees one input() prompt at a time.
+    Real headcounts live in files, so this loader streams Developer/Manager rows from
+    CSV or JSONL in chunks and turns every chunk into a PayrollTable (see 19. OOP Project-PayrollTable.py).
+
+File layout (CSV needs the header, JSONL uses the same keys):
+    role,name,base_salary,bonus,incentives
+    developer,Alice,70000,10000,
+    manager,Bob,90000,,15000
+
+    - role is "developer" or "manager" (any case)
+    - an empty bonus / incentives means 0
+
+💡 Why useful?
+1. Memory stays flat - only one chunk is in memory at a time
+2. No Python object per row unless you ask for one (iter_employees)
+3. Same validation as the setters: money values must be non-negative
+'''
+
+import csv
+import json
+import os
+import tempfile
+import time
+from collections import namedtuple
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# LOAD THE PAYROLL TABLE LESSON
+# -------------------------------
+payroll_table = load_lesson("payroll_table")
+PayrollTable = payroll_table.PayrollTable
+Developer = payroll_table.Developer
+Manager = payroll_table.Manager
+
+FIELDS = ("role", "name", "base_salary", "bonus", "incentives")
+ROLE_CODES = {"developer": payroll_table.ROLE_DEVELOPER, "manager": payroll_table.ROLE_MANAGER}
+
+# A row that couldn't even be split into fields - yielded instead of raising, so one broken
+# line doesn't stop a load of millions
+BadRow = namedtuple("BadRow", "message")
+
+
+# -------------------------------
+# READING RAW ROWS
+# -------------------------------
+def _csv_rows(file):
+    reader = csv.reader(file)
+    header = [column.strip().lower() for column in next(reader, [])]
+    missing = set(FIELDS) - set(header)
+    if missing:
+        raise ValueError(f"CSV header is missing columns: {sorted(missing)}")
+    order = [header.index(field) for field in FIELDS]
+    for row in reader:
+        if not row:
+            continue
+        try:
+            yield tuple(row[i] for i in order)
+        except IndexError:
+            yield BadRow(f"expected {len(header)} columns, got {len(row)}")
+
+
+def _jsonl_rows(file):
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            yield BadRow(f"invalid JSON: {error}")
+            continue
+        if not isinstance(record, dict):
+            yield BadRow(f"expected a JSON object, got {type(record).__name__}")
+            continue
+        yield tuple(record.get(field, "") for field in FIELDS)
+
+
+def detect_format(path):
+    suffix = Path(path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    raise ValueError(f"Cannot detect file format from extension: {path}")
+
+
+# -------------------------------
+# TURNING A CHUNK INTO COLUMNS
+# -------------------------------
+def _money_column(values):
+    # '' (or None from JSONL) means "not given" -> 0
+    return np.array([v if v not in ("", None) else 0 for v in values], dtype=np.float64)
+
+
+def _rows_to_table(rows):
+    """Fast path: convert a whole chunk at once. Raises if any row is bad."""
+    roles, names, base_salary, bonus, incentives = zip(*rows)
+    role_codes = np.array([ROLE_CODES[str(r).strip().lower()] for r in roles], dtype=np.uint8)
+    return PayrollTable(names, role_codes, _money_column(base_salary),
+                        _money_column(bonus), _money_column(incentives))
+
+
+def _row_error(row):
+    """Slow path: explain what is wrong with a single row (None if it is fine)."""
+    if isinstance(row, BadRow):
+        return row.message
+    role, _name, *money = row
+    if str(role).strip().lower() not in ROLE_CODES:
+        return f"unknown role {role!r}"
+    for field, value in zip(FIELDS[2:], money):
+        try:
+            amount = float(value) if value not in ("", None) else 0.0
+        except (TypeError, ValueError):
+            return f"{field} is not a number: {value!r}"
+        if not np.isfinite(amount):
+            return f"{field} must be a finite number, got {value!r}"
+        if amount < 0:
+            return f"{field} must be non-negative, got {amount}"
+    return None
+
+
+def iter_payroll_chunks(path, chunk_size=100_000, fmt=None, errors=None):
+    """Yield PayrollTable chunks of at most `chunk_size` valid rows.
+
+    Invalid rows - bad values, too few CSV columns, broken JSON lines - are skipped;
+    pass a list as `errors` to collect (row_number, message) tuples for them.
+    """
+    fmt = fmt or detect_format(path)
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        rows = _csv_rows(file) if fmt == "csv" else _jsonl_rows(file)
+        row_number = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            try:
+                table = _rows_to_table(chunk)
+            except (KeyError, TypeError, ValueError):
+                # Something in this chunk is bad - find it row by row, keep the rest
+                good = []
+                for offset, row in enumerate(chunk):
+                    message = _row_error(row)
+                    if message is None:
+                        good.append(row)
+                    elif errors is not None:
+                        errors.append((row_number + offset + 1, message))
+                table = _rows_to_table(good) if good else None
+            row_number += len(chunk)
+            if table is not None:
+                yield table
+
+
+def load_payroll(path, chunk_size=100_000, fmt=None, errors=None):
+    """Load a whole file into one PayrollTable."""
+    return PayrollTable.concat(iter_payroll_chunks(path, chunk_size, fmt, errors))
+
+
+def iter_employees(path, chunk_size=100_000, fmt=None, errors=None):
+    """Yield Developer / Manager objects - only when you really need objects."""
+    for table in iter_payroll_chunks(path, chunk_size, fmt, errors):
+        for i in range(len(table)):
+            yield table.employee_at(i)
+
+
+# -------------------------------
+# BENCHMARK: ROWS PER SECOND
+# -------------------------------
+def write_sample(path, n, fmt):
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if fmt == "csv":
+            writer = csv.writer(file)
+            writer.writerow(FIELDS)
+            for i in range(n):
+                if i % 2:
+                    writer.writerow(("manager", f"emp{i}", 90000 + i % 1000, "", 15000))
+                else:
+                    writer.writerow(("developer", f"emp{i}", 70000 + i % 1000, 10000, ""))
+        else:
+            for i in range(n):
+                role = "manager" if i % 2 else "developer"
+                record = {"role": role, "name": f"emp{i}", "base_salary": 70000 + i % 1000,
+                          "bonus": 0 if i % 2 else 10000, "incentives": 15000 if i % 2 else 0}
+                file.write(json.dumps(record) + "\n")
+
+
+def benchmark(n=1_000_000):
+    with tempfile.TemporaryDirectory() as folder:
+        for fmt in ("csv", "jsonl"):
+            path = os.path.join(folder, f"payroll.{fmt}")
+            write_sample(path, n, fmt)
+
+            start = time.perf_counter()
+            table = load_payroll(path)
+            elapsed = time.perf_counter() - start
+
+            assert len(table) == n
+            print(f"{fmt:>5}: {n:,} rows in {elapsed:.2f} s -> {n / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "team.csv")
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write("role,name,base_salary,bonus,incentives\n"
+                       "developer,Alice,70000,10000,\n"
+                       "manager,Bob,90000,,15000\n"
+                       "manager,Eve,-5,,100\n"
+                       "manager,Bo\n"
+                       "developer,Nan,nan,,\n")
+
+        problems = []
+        table = load_payroll(path, errors=problems)
+        print(table.total_salaries())   # Output: [ 80000. 105000.]
+        for problem in problems:
+            print(problem)
+        # Output: (3, 'base_salary must be non-negative, got -5.0')
+        #         (4, 'expected 5 columns, got 2')
+        #         (5, "base_salary must be a finite number, got 'nan'")
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Streaming            | `iter_payroll_chunks()` reads `chunk_size` rows at a time                |
+# | CSV and JSONL        | `csv.reader` / `json.loads`, format picked from the file extension       |
+# | Validation           | Finite, non-negative money, known roles; bad rows collected, not raised  |
+# | Objects on demand    | `iter_employees()` builds Developer / Manager objects only when asked    |
+# | Benchmark            | rows per second for CSV and JSONL                                        |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,295 @@
+'''
+🗂️ Indexed Employee Registry — "Find Anyone in O(1)"
+Idea: main() in 19. OOP Project-EmployeeSalary.py keeps `employees = []`. Finding or updating
+    someone means scanning the whole list, and there is no way to delete anybody.
+
+    EmployeeRegistry keeps three indexes next to the employees:
+        1. ID   -> employee          (dict, O(1))
+        2. name -> set of IDs        (dict, O(1), names don't have to be unique)
+        3. (total salary, ID) pairs  (sorted list + bisect, for top-N and salary ranges)
+
+    To keep the salary index correct without rescanning, employees tell the registry when a
+    setter really changes a value. TrackedDeveloper / TrackedManager are the original classes
+    with "observed" properties: the setter runs the ORIGINAL validation, then notifies subscribers.
+
+💡 Why useful?
+1. Lookup, update and delete by ID or name without a linear scan
+2. "Top 10 earners" and "everyone between ₹50k and ₹80k" are binary searches
+3. emp.bonus = 20000 updates the indexes automatically
+'''
+
+import bisect
+import itertools
+import random
+import time
+from functools import partial
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# LOAD THE ORIGINAL PAYROLL CLASSES
+# -------------------------------
+payroll = load_lesson("employee_salary")
+Employee = payroll.Employee
+Developer = payroll.Developer
+Manager = payroll.Manager
+
+
+# -------------------------------
+# OBSERVABLE EMPLOYEES
+# -------------------------------
+class Observable:
+    """Mixin: lets other objects subscribe to value changes made through setters."""
+
+    def subscribe(self, callback):
+        # callback(employee, field, old_value, new_value)
+        if "_subscribers" not in self.__dict__:
+            self._subscribers = []
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.__dict__.get("_subscribers", []).remove(callback)
+
+    def _changed(self, field, old, new):
+        for callback in self.__dict__.get("_subscribers", ()):
+            callback(self, field, old, new)
+
+
+def observed(prop, field):
+    """Wrap an existing property: keep its getter and validation, notify after a real change."""
+    def setter(self, value):
+        old = prop.fget(self)
+        prop.fset(self, value)          # Original setter decides if the value is valid
+        new = prop.fget(self)
+        if new != old:
+            self._changed(field, old, new)
+    return property(prop.fget, setter)
+
+
+class TrackedDeveloper(Observable, Developer):
+    name = observed(Employee.name, "name")
+    base_salary = observed(Employee.base_salary, "base_salary")
+    bonus = observed(Developer.bonus, "bonus")
+
+
+class TrackedManager(Observable, Manager):
+    name = observed(Employee.name, "name")
+    base_salary = observed(Employee.base_salary, "base_salary")
+    incentives = observed(Manager.incentives, "incentives")
+
+
+# -------------------------------
+# EMPLOYEE REGISTRY
+# -------------------------------
+class EmployeeRegistry:
+    """Employees indexed by ID, by name and by total salary."""
+
+    def __init__(self):
+        self._by_id = {}                # id -> employee
+        self._by_name = {}              # name -> {ids}
+        self._salary_index = []         # sorted [(total_salary, id)]
+        self._salary_of = {}            # id -> total salary currently in the index
+        self._callbacks = {}            # id -> subscribed callback (to unsubscribe on delete)
+        self._next_id = itertools.count(1)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, emp_id):
+        return emp_id in self._by_id
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    # ---- add / remove ----
+    def add(self, emp, emp_id=None):
+        """Register an employee and return its (integer) ID."""
+        emp_id = self._register(emp, emp_id)
+        try:
+            self._index_salary(emp_id, emp.calculate_salary())
+        except BaseException:
+            self._unregister(emp_id)    # All indexes or none
+            raise
+        return emp_id
+
+    def extend(self, employees):
+        """Register many employees, sorting the salary index once at the end."""
+        ids, entries = [], []
+        try:
+            for emp in employees:
+                ids.append(self._register(emp, None))
+                entries.append((emp.calculate_salary(), ids[-1]))
+        except BaseException:
+            for emp_id in ids:          # All of the batch or none of it, like add()
+                self._unregister(emp_id)
+            raise
+        self._salary_index += entries
+        self._salary_index.sort()
+        self._salary_of.update((emp_id, salary) for salary, emp_id in entries)
+        return ids
+
+    def _register(self, emp, emp_id):
+        if emp_id is None:
+            emp_id = next(self._next_id)
+            while emp_id in self._by_id:
+                emp_id = next(self._next_id)
+        elif not isinstance(emp_id, int):
+            # The salary index sorts (salary, id) pairs - ids must compare with each other
+            raise TypeError(f"Employee IDs must be integers, got {emp_id!r}")
+        elif emp_id in self._by_id:
+            raise KeyError(f"Employee ID {emp_id} is already registered!")
+
+        self._by_id[emp_id] = emp
+        self._by_name.setdefault(emp.name, set()).add(emp_id)
+
+        if isinstance(emp, Observable):
+            callback = partial(self._on_change, emp_id)
+            emp.subscribe(callback)
+            self._callbacks[emp_id] = callback
+        return emp_id
+
+    def _unregister(self, emp_id):
+        emp = self._by_id.pop(emp_id)
+        self._unindex_name(emp.name, emp_id)
+        callback = self._callbacks.pop(emp_id, None)
+        if callback is not None:
+            emp.unsubscribe(callback)
+        return emp
+
+    def remove(self, emp_id):
+        emp = self._unregister(emp_id)
+        self._unindex_salary(emp_id)
+        return emp
+
+    # ---- lookups ----
+    def get(self, emp_id):
+        return self._by_id[emp_id]
+
+    def find_by_name(self, name):
+        return [self._by_id[emp_id] for emp_id in sorted(self._by_name.get(name, ()))]
+
+    def top_earners(self, n):
+        return [self._by_id[emp_id] for _, emp_id in reversed(self._salary_index[-n:])] if n > 0 else []
+
+    def salary_range(self, low, high):
+        """Employees with low <= total salary <= high, lowest first."""
+        start = bisect.bisect_left(self._salary_index, (low, float("-inf")))
+        end = bisect.bisect_right(self._salary_index, (high, float("inf")))
+        return [self._by_id[emp_id] for _, emp_id in self._salary_index[start:end]]
+
+    # ---- updates ----
+    def update(self, emp_id, **fields):
+        """Set fields through the employee's own setters, e.g. update(7, bonus=5000)."""
+        emp = self._by_id[emp_id]
+        old_name = emp.name
+        for field, value in fields.items():
+            setattr(emp, field, value)
+        if not isinstance(emp, Observable):
+            # Plain Developer / Manager can't notify us, so reindex this one employee
+            self._reindex(emp_id, emp, old_name)
+
+    def _on_change(self, emp_id, emp, field, old, new):
+        self._reindex(emp_id, emp, old if field == "name" else emp.name)
+
+    def _reindex(self, emp_id, emp, old_name):
+        if emp.name != old_name:
+            self._unindex_name(old_name, emp_id)
+            self._by_name.setdefault(emp.name, set()).add(emp_id)
+        salary = emp.calculate_salary()
+        if salary != self._salary_of[emp_id]:
+            self._unindex_salary(emp_id)
+            self._index_salary(emp_id, salary)
+
+    # ---- index helpers ----
+    def _index_salary(self, emp_id, salary):
+        bisect.insort(self._salary_index, (salary, emp_id))
+        self._salary_of[emp_id] = salary
+
+    def _unindex_salary(self, emp_id):
+        key = (self._salary_of.pop(emp_id), emp_id)
+        del self._salary_index[bisect.bisect_left(self._salary_index, key)]
+
+    def _unindex_name(self, name, emp_id):
+        ids = self._by_name[name]
+        ids.discard(emp_id)
+        if not ids:
+            del self._by_name[name]
+
+
+# -------------------------------
+# BENCHMARK: LIST SCAN vs REGISTRY
+# -------------------------------
+def benchmark(n=200_000, lookups=500):
+    rng = random.Random(0)
+    employees = [
+        TrackedDeveloper(f"emp{i}", rng.randrange(30_000, 200_000), rng.randrange(50_000))
+        if i % 2 else
+        TrackedManager(f"emp{i}", rng.randrange(30_000, 200_000), rng.randrange(50_000))
+        for i in range(n)
+    ]
+
+    start = time.perf_counter()
+    registry = EmployeeRegistry()
+    registry.extend(employees)
+    build_time = time.perf_counter() - start
+
+    targets = [f"emp{rng.randrange(n)}" for _ in range(lookups)]
+
+    start = time.perf_counter()
+    for name in targets:
+        next(emp for emp in employees if emp.name == name)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in targets:
+        registry.find_by_name(name)
+    index_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    registry.top_earners(10)
+    registry.salary_range(100_000, 110_000)
+    query_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for emp in rng.sample(employees, lookups):
+        emp.base_salary = emp.base_salary + 1000     # setter -> registry reindexes
+    raise_time = time.perf_counter() - start
+
+    print(f"{n:,} employees, {lookups:,} operations each")
+    print(f"  build registry          : {build_time:.3f} s")
+    print(f"  find by name (list scan): {scan_time:.3f} s")
+    print(f"  find by name (registry) : {index_time:.4f} s")
+    print(f"  top 10 + salary range   : {query_time:.4f} s")
+    print(f"  raises via setters      : {raise_time:.4f} s (salary index updated in place)")
+
+
+if __name__ == "__main__":
+    registry = EmployeeRegistry()
+    alice = registry.add(TrackedDeveloper("Alice", 70000, 10000))
+    bob = registry.add(TrackedManager("Bob", 90000, 15000))
+    carol = registry.add(Developer("Carol", 60000, 5000))     # Plain class works too
+
+    print([e.name for e in registry.top_earners(2)])          # Output: ['Bob', 'Alice']
+
+    registry.get(alice).bonus = 50000                         # Setter -> index updated
+    print([e.name for e in registry.top_earners(1)])          # Output: ['Alice']
+
+    registry.update(carol, base_salary=100000)                # Plain class -> update()
+    print([e.name for e in registry.salary_range(100000, 110000)])  # Output: ['Bob', 'Carol']
+
+    registry.remove(bob)
+    print(registry.find_by_name("Bob"), len(registry))        # Output: [] 2
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Hash indexes         | `dict` by ID, `dict` of ID sets by name                                  |
+# | Sorted index         | `bisect` over (total salary, ID) pairs: `top_earners()`, `salary_range()`|
+# | Delete               | `remove()` drops the employee from every index                           |
+# | Incremental updates  | `observed()` setters notify the registry; `update()` for plain classes   |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,210 @@
+'''
+💾 Memory-Mapped Employee Store — "Open 10M Employees Instantly"
+Idea: main() in 19. OOP Project-EmployeeSalary.py forgets everything on exit. Saving employees as
+    text (CSV / JSON) means parsing every row again on the next start.
+
+    This store writes every employee as a FIXED-WIDTH binary record:
+
+        | role u1 | name 32 bytes | base_salary f8 | bonus f8 | incentives f8 |   = 57 bytes
+
+    after a small header. Because every record has the same size, record i lives at
+        HEADER_SIZE + i * 57
+    and the whole file can be memory-mapped (mmap) as one NumPy structured array.
+
+💡 Why useful?
+1. Opening is instant - the OS loads pages only when they are touched
+2. No parsing at all: the bytes on disk ARE the array
+3. Salaries are computed straight from the mapped columns (zero copies of the data)
+
+⚠️ Notes:
+1. Names longer than 32 UTF-8 bytes are cut
+2. The file uses little-endian numbers, so it is portable between machines
+'''
+
+import os
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# LOAD THE PAYROLL TABLE LESSON
+# -------------------------------
+payroll_table = load_lesson("payroll_table")
+PayrollTable = payroll_table.PayrollTable
+Developer = payroll_table.Developer
+Manager = payroll_table.Manager
+ROLE_DEVELOPER = payroll_table.ROLE_DEVELOPER
+
+
+# -------------------------------
+# FILE LAYOUT
+# -------------------------------
+MAGIC = b"EMPSTOR1"
+HEADER = struct.Struct("<8sQ")      # magic, record count
+HEADER_SIZE = 64                    # header is padded, leaving room for future fields
+NAME_BYTES = 32
+
+RECORD = np.dtype([
+    ("role", "u1"),
+    ("name", f"S{NAME_BYTES}"),
+    ("base_salary", "<f8"),
+    ("bonus", "<f8"),
+    ("incentives", "<f8"),
+])
+
+
+def _records_from_table(table, start=0, end=None):
+    end = len(table) if end is None else end
+    records = np.empty(end - start, dtype=RECORD)
+    records["role"] = table.roles[start:end]
+    records["name"] = [name.encode("utf-8")[:NAME_BYTES] for name in table.names[start:end]]
+    records["base_salary"] = table.base_salary[start:end]
+    records["bonus"] = table.bonus[start:end]
+    records["incentives"] = table.incentives[start:end]
+    return records
+
+
+# -------------------------------
+# WRITING
+# -------------------------------
+def write_store(path, table, chunk_rows=1_000_000):
+    """Save a PayrollTable (or a list of employees) as a fixed-width binary file."""
+    if not isinstance(table, PayrollTable):
+        table = PayrollTable.from_employees(table)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(table)).ljust(HEADER_SIZE, b"\0"))
+        for start in range(0, len(table), chunk_rows):
+            file.write(_records_from_table(table, start, start + chunk_rows).tobytes())
+
+
+def append_store(path, table):
+    """Add employees to the end of an existing store and bump the record count."""
+    if not isinstance(table, PayrollTable):
+        table = PayrollTable.from_employees(table)
+    with open(path, "r+b") as file:
+        magic, count = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an employee store!")
+        file.seek(HEADER_SIZE + count * RECORD.itemsize)
+        file.write(_records_from_table(table).tobytes())
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, count + len(table)))
+
+
+# -------------------------------
+# READING (MEMORY-MAPPED)
+# -------------------------------
+class EmployeeStore:
+    """Read-only, memory-mapped view of an employee store file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            magic, count = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an employee store!")
+        self.path = path
+        # np.memmap maps the file - nothing is read until a page is touched
+        self.records = np.memmap(path, dtype=RECORD, mode="r", offset=HEADER_SIZE, shape=(count,)) \
+            if count else np.empty(0, dtype=RECORD)
+
+    def __len__(self):
+        return len(self.records)
+
+    # Column views point straight into the mapped file (no copy)
+    @property
+    def roles(self):
+        return self.records["role"]
+
+    @property
+    def base_salary(self):
+        return self.records["base_salary"]
+
+    @property
+    def bonus(self):
+        return self.records["bonus"]
+
+    @property
+    def incentives(self):
+        return self.records["incentives"]
+
+    # Same rule as Developer / Manager.calculate_salary(), evaluated over the mapped buffer
+    def total_salaries(self, start=0, end=None):
+        rows = self.records[start:end]
+        extra = np.where(rows["role"] == ROLE_DEVELOPER, rows["bonus"], rows["incentives"])
+        return rows["base_salary"] + extra
+
+    def total_payroll(self, chunk_rows=4_000_000):
+        # Chunked so the temporary result arrays stay small for huge files
+        return float(sum(self.total_salaries(start, start + chunk_rows).sum()
+                         for start in range(0, len(self), chunk_rows)))
+
+    def employee_at(self, i):
+        row = self.records[i]
+        name = row["name"].decode("utf-8", errors="ignore")
+        if row["role"] == ROLE_DEVELOPER:
+            return Developer(name, float(row["base_salary"]), float(row["bonus"]))
+        return Manager(name, float(row["base_salary"]), float(row["incentives"]))
+
+    def to_table(self):
+        """Copy everything into a PayrollTable (this one DOES read the whole file)."""
+        names = [name.decode("utf-8", errors="ignore") for name in self.records["name"].tolist()]
+        return PayrollTable(names, self.roles, self.base_salary, self.bonus, self.incentives)
+
+
+# -------------------------------
+# BENCHMARK
+# -------------------------------
+def benchmark(n=10_000_000):
+    table = payroll_table.random_table(n)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "employees.bin")
+
+        start = time.perf_counter()
+        write_store(path, table)
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = EmployeeStore(path)
+        open_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        total = store.total_payroll()
+        total_time = time.perf_counter() - start
+
+        assert total == table.total_payroll()
+        size = os.path.getsize(path) / 2**20
+        print(f"{n:,} employees ({size:,.0f} MiB on disk)")
+        print(f"  write store        : {write_time:.2f} s")
+        print(f"  open (mmap)        : {open_time * 1000:.2f} ms")
+        print(f"  total payroll      : {total_time:.2f} s  (straight from the mapped file)")
+        del store
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "team.bin")
+        write_store(path, [Developer("Alice", 70000, 10000)])
+        append_store(path, [Manager("Bob", 90000, 15000)])
+
+        store = EmployeeStore(path)
+        print(len(store), store.total_salaries())     # Output: 2 [ 80000. 105000.]
+        print(store.employee_at(1).get_details())     # Output: Name: Bob, Base Salary: ₹90000.0
+        del store                                     # Release the mapping before the folder is removed
+
+    benchmark(2_000_000)
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Fixed-width records  | NumPy structured dtype, 57 bytes per employee after a 64-byte header     |
+# | Persistence          | `write_store()` / `append_store()`                                       |
+# | Instant open         | `np.memmap` - pages are loaded only when touched                         |
+# | Zero-copy compute    | `total_salaries()` works on column views of the mapped buffer            |
+# |______________________|__________________________________________________________________________|
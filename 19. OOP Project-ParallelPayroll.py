@@ -0,0 +1,161 @@
+'''
+⚙️ Parallel Payroll Runner — "Use Every Core for calculate_salary()"
+Idea: Any subclass of the abstract Employee can override calculate_salary() with its own logic,
+    so we can't always turn the payroll into NumPy columns (19. OOP Project-PayrollTable.py).
+    display_employee() / display_salary() still walk the list one object at a time on ONE core.
+
+    This runner:
+        1. cuts the employee list into contiguous shards
+        2. sends each shard to a worker process (ProcessPoolExecutor)
+        3. every worker calls calculate_salary() on its shard - whatever the subclass does
+        4. results come back in the original order
+
+💡 Why useful?
+1. Works with ANY calculate_salary() implementation (polymorphism still decides what runs)
+2. CPU-heavy salary rules scale with the number of cores
+3. Order of results always matches the order of the input list
+
+⚠️ Notes:
+1. Objects are pickled to reach the workers, so the classes must live at module level
+2. For cheap rules (base + bonus) pickling costs more than the maths - use PayrollTable for those
+'''
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# LOAD THE ORIGINAL PAYROLL CLASSES
+# -------------------------------
+payroll = load_lesson("employee_salary")
+Employee = payroll.Employee
+Developer = payroll.Developer
+Manager = payroll.Manager
+
+
+# -------------------------------
+# A SUBCLASS WITH A CUSTOM (CPU-HEAVY) RULE
+# -------------------------------
+class Contractor(Employee):
+    """Paid per hour from a timesheet, with 1.5x overtime above 8 hours a day."""
+
+    def __init__(self, name, hourly_rate, timesheet):
+        super().__init__(name, 0)
+        self.hourly_rate = hourly_rate
+        self.timesheet = timesheet      # hours worked per day
+
+    def calculate_salary(self):
+        total = 0.0
+        for hours in self.timesheet:
+            regular = min(hours, 8)
+            overtime = hours - regular
+            total += (regular + 1.5 * overtime) * self.hourly_rate
+        return self.base_salary + total
+
+
+# -------------------------------
+# PARALLEL RUNNER
+# -------------------------------
+def _salaries_of(shard):
+    # Runs inside a worker process
+    return [emp.calculate_salary() for emp in shard]
+
+
+def shard(items, count):
+    """Split a list into `count` contiguous, nearly equal pieces (order is kept)."""
+    size, extra = divmod(len(items), count)
+    pieces, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        pieces.append(items[start:end])
+        start = end
+    return [piece for piece in pieces if piece]
+
+
+def parallel_salaries(employees, workers=None, shards_per_worker=4):
+    """Return [emp.calculate_salary() for emp in employees], computed on a process pool."""
+    employees = list(employees)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return _salaries_of(employees)
+
+    pieces = shard(employees, workers * shards_per_worker)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields shard results in submission order, so extending keeps the input order
+        for salaries in pool.map(_salaries_of, pieces):
+            results.extend(salaries)
+    return results
+
+
+def display_all(employees, workers=None):
+    """Parallel version of looping display_employee() - maths in parallel, printing in order."""
+    for emp, salary in zip(employees, parallel_salaries(employees, workers)):
+        print(f"{emp.get_details()} | Total Salary: ₹{salary}")
+
+
+# -------------------------------
+# SCALING BENCHMARK
+# -------------------------------
+def make_staff(n):
+    staff = []
+    for i in range(n):
+        if i % 3 == 0:
+            staff.append(Developer(f"dev{i}", 70000, 10000))
+        elif i % 3 == 1:
+            staff.append(Manager(f"mgr{i}", 90000, 15000))
+        else:
+            timesheet = [8 + (day + i) % 4 for day in range(220)]
+            staff.append(Contractor(f"con{i}", 500, timesheet))
+    return staff
+
+
+def benchmark(n=60_000, max_workers=None):
+    staff = make_staff(n)
+    max_workers = max_workers or os.cpu_count() or 1
+    expected = [emp.calculate_salary() for emp in staff]
+
+    print(f"{n:,} employees (one third are Contractors with a 220-day timesheet)")
+    print("  workers |  time (s) | speedup | efficiency")
+    baseline = None
+    workers = 1
+    while True:
+        start = time.perf_counter()
+        result = parallel_salaries(staff, workers)
+        elapsed = time.perf_counter() - start
+        assert result == expected
+
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(f"  {workers:7} | {elapsed:9.3f} | {speedup:6.2f}x | {speedup / workers:9.0%}")
+
+        if workers == max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
+
+if __name__ == "__main__":
+    team = [Developer("Alice", 70000, 10000),
+            Manager("Bob", 90000, 15000),
+            Contractor("Carol", 500, [8, 10, 6])]
+    display_all(team, workers=2)
+    # Output:
+    # Name: Alice, Base Salary: ₹70000 | Total Salary: ₹80000
+    # Name: Bob, Base Salary: ₹90000 | Total Salary: ₹105000
+    # Name: Carol, Base Salary: ₹0 | Total Salary: ₹12500.0
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Polymorphism         | Workers just call `calculate_salary()` - any subclass works              |
+# | Sharding             | `shard()` splits the list into contiguous, nearly equal pieces           |
+# | Ordered merge        | `ProcessPoolExecutor.map()` returns shards in submission order           |
+# | Scaling report       | Speedup and efficiency (speedup / workers) for 1, 2, 4 ... N workers     |
+# |______________________|__________________________________________________________________________|
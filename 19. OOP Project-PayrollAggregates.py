@@ -0,0 +1,218 @@
+'''
+📊 Incremental Payroll Aggregates — "Never Re-add the Whole Company"
+Idea: After every raise we used to recompute company and department totals from scratch:
+        total = sum(emp.calculate_salary() for emp in employees)     # O(headcount) every time
+
+    But the base_salary / bonus / incentives setters already see every change. With the observed
+    setters from 19. OOP Project-EmployeeRegistry.py, PayrollAggregates subscribes to each employee
+    and only applies the DIFFERENCE:
+
+        emp.bonus = 20000   ->   total += new_salary - old_salary
+
+    It keeps: sum, count, min, max and per-role sum/count.
+
+💡 Why useful?
+1. Reading the company payroll is O(1), no matter how many employees there are
+2. A raise costs O(1) for sum/count/per-role (O(log n) for min/max bookkeeping)
+3. Works with any subclass that uses observed setters
+
+⚠️ Notes:
+1. min/max use two heaps with "lazy deletion": old values stay in the heap until they reach the top
+2. Float sums can drift after millions of updates - recompute() rebuilds everything from scratch
+'''
+
+import heapq
+import random
+import time
+from collections import Counter
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# LOAD THE OBSERVABLE EMPLOYEES
+# -------------------------------
+registry = load_lesson("employee_registry")
+Observable = registry.Observable
+Developer = registry.Developer
+Manager = registry.Manager
+TrackedDeveloper = registry.TrackedDeveloper
+TrackedManager = registry.TrackedManager
+
+
+def role_of(emp):
+    if isinstance(emp, Developer):
+        return "Developer"
+    if isinstance(emp, Manager):
+        return "Manager"
+    return type(emp).__name__
+
+
+# -------------------------------
+# INCREMENTAL AGGREGATES
+# -------------------------------
+class PayrollAggregates:
+    """Running sum / count / min / max / per-role totals of total salaries."""
+
+    def __init__(self, employees=()):
+        self._salary_of = {}            # id(emp) -> (emp, salary counted in the aggregates)
+        self._reset()
+        for emp in employees:
+            self.add(emp)
+
+    def _reset(self):
+        self.total = 0
+        self.count = 0
+        self.role_totals = {}
+        self.role_counts = Counter()
+        self._values = Counter()        # salary -> how many employees earn exactly that
+        self._min_heap = []
+        self._max_heap = []             # stores -salary
+
+    # ---- membership ----
+    def add(self, emp):
+        # Without observed setters a raise would never reach us - refuse before counting anything
+        if not isinstance(emp, Observable):
+            raise TypeError(f"{type(emp).__name__} has no observed setters - "
+                            f"use TrackedDeveloper / TrackedManager (or mix in Observable)")
+        if id(emp) in self._salary_of:
+            raise ValueError(f"{emp.name} is already counted!")
+        salary = emp.calculate_salary()
+        self._salary_of[id(emp)] = (emp, salary)
+        self._include(role_of(emp), salary)
+        emp.subscribe(self._on_change)
+
+    def remove(self, emp):
+        _, salary = self._salary_of.pop(id(emp))
+        self._exclude(role_of(emp), salary)
+        emp.unsubscribe(self._on_change)
+
+    def _on_change(self, emp, field, old, new):
+        # Called by the observed setter AFTER the new value is stored
+        if field == "name":
+            return
+        _, old_salary = self._salary_of[id(emp)]
+        new_salary = emp.calculate_salary()
+        if new_salary != old_salary:
+            role = role_of(emp)
+            self._exclude(role, old_salary)
+            self._include(role, new_salary)
+            self._salary_of[id(emp)] = (emp, new_salary)
+
+    # ---- bookkeeping ----
+    def _include(self, role, salary):
+        self.total += salary
+        self.count += 1
+        self.role_totals[role] = self.role_totals.get(role, 0) + salary
+        self.role_counts[role] += 1
+        if self._values[salary] == 0:
+            heapq.heappush(self._min_heap, salary)
+            heapq.heappush(self._max_heap, -salary)
+        self._values[salary] += 1
+
+    def _exclude(self, role, salary):
+        self.total -= salary
+        self.count -= 1
+        self.role_totals[role] -= salary
+        self.role_counts[role] -= 1
+        if not self.role_counts[role]:
+            del self.role_counts[role]
+            del self.role_totals[role]
+        self._values[salary] -= 1
+        if not self._values[salary]:
+            del self._values[salary]    # Heap entry is dropped lazily in minimum / maximum
+
+    # ---- reading ----
+    @property
+    def minimum(self):
+        while self._min_heap and self._min_heap[0] not in self._values:
+            heapq.heappop(self._min_heap)
+        return self._min_heap[0] if self._min_heap else None
+
+    @property
+    def maximum(self):
+        while self._max_heap and -self._max_heap[0] not in self._values:
+            heapq.heappop(self._max_heap)
+        return -self._max_heap[0] if self._max_heap else None
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def recompute(self):
+        """Rebuild every aggregate from the employees themselves (fixes float drift)."""
+        employees = [emp for emp, _ in self._salary_of.values()]
+        self._reset()
+        for emp in employees:
+            salary = emp.calculate_salary()
+            self._salary_of[id(emp)] = (emp, salary)
+            self._include(role_of(emp), salary)
+
+    def summary(self):
+        return {"total": self.total, "count": self.count, "min": self.minimum,
+                "max": self.maximum, "by_role": dict(self.role_totals)}
+
+
+# -------------------------------
+# BENCHMARK: RECOMPUTE vs INCREMENTAL
+# -------------------------------
+def benchmark(n=200_000, raises=50):
+    rng = random.Random(0)
+    employees = [
+        TrackedDeveloper(f"emp{i}", rng.randrange(30_000, 200_000), rng.randrange(50_000))
+        if i % 2 else
+        TrackedManager(f"emp{i}", rng.randrange(30_000, 200_000), rng.randrange(50_000))
+        for i in range(n)
+    ]
+    aggregates = PayrollAggregates(employees)
+    lucky = rng.sample(employees, raises)
+
+    start = time.perf_counter()
+    for emp in lucky:
+        emp.base_salary += 1000
+        sum(e.calculate_salary() for e in employees)     # the old way: full recompute
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for emp in lucky:
+        emp.base_salary += 1000
+        aggregates.total                                  # O(1) read
+    incremental_time = time.perf_counter() - start
+
+    assert aggregates.total == sum(e.calculate_salary() for e in employees)
+    print(f"{n:,} employees, {raises} raises, company total read after each one")
+    print(f"  full recompute : {full_time:.3f} s")
+    print(f"  incremental    : {incremental_time:.4f} s")
+
+
+if __name__ == "__main__":
+    alice = TrackedDeveloper("Alice", 70000, 10000)
+    bob = TrackedManager("Bob", 90000, 15000)
+    stats = PayrollAggregates([alice, bob])
+    print(stats.summary())
+    # Output: {'total': 185000, 'count': 2, 'min': 80000, 'max': 105000,
+    #          'by_role': {'Developer': 80000, 'Manager': 105000}}
+
+    alice.bonus = 50000         # Setter -> aggregates updated
+    bob.incentives = -1         # Rejected by the original setter -> nothing changes
+    print(stats.total, stats.maximum)   # Output: 225000 120000
+
+    try:
+        stats.add(Developer("Carol", 60000, 5000))     # Plain Developer: changes can't be seen
+    except TypeError as error:
+        print(error)
+    # Output: Developer has no observed setters - use TrackedDeveloper / TrackedManager (or mix in Observable)
+    print(stats.count)                  # Output: 2 (nothing was counted)
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Subscriptions        | `emp.subscribe()` on the observed setters from the registry lesson       |
+# | O(1) reads           | `total`, `count`, `mean`, `role_totals`, `role_counts`                   |
+# | min / max            | Two heaps with lazy deletion + a Counter of live salary values           |
+# | Safety net           | `recompute()` rebuilds everything from the employees                     |
+# |______________________|__________________________________________________________________________|
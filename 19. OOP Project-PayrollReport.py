@@ -0,0 +1,196 @@
+'''
+🖨️ Buffered Payroll Report Writer — "Write in Chunks, Not Lines"
+Idea: display_employee() in 19. OOP Project-EmployeeSalary.py makes three print() calls per employee.
+    Every print() is a separate write to the terminal/file, so a full payroll report is limited by
+    system calls, not by Python.
+
+    This writer:
+        1. formats a whole chunk of rows with one precompiled format string
+        2. joins the chunk into ONE string
+        3. writes it to a large binary buffer (file or stdout)
+
+Supported formats:
+    text  -> Name: Alice, Role: Developer, Base Salary: ₹70000.00 | Total Salary: ₹80000.00
+    csv   -> name,role,base_salary,bonus,incentives,total_salary
+    fixed -> fixed-width columns, easy to read and easy to parse by position
+
+💡 Why useful?
+1. A few hundred large writes instead of millions of tiny ones
+2. Works straight from a PayrollTable (no objects) or from Developer / Manager objects
+3. The same code streams to a file or to stdout
+'''
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# LOAD THE PAYROLL LESSONS
+# -------------------------------
+payroll_table = load_lesson("payroll_table")
+PayrollTable = payroll_table.PayrollTable
+Developer = payroll_table.Developer
+Manager = payroll_table.Manager
+ROLE_NAMES = payroll_table.ROLE_NAMES
+
+CSV_HEADER = ("name", "role", "base_salary", "bonus", "incentives", "total_salary")
+
+# One format string per layout - parsed once, reused for every row
+TEXT_LINE = "Name: {}, Role: {}, Base Salary: ₹{:.2f} | Total Salary: ₹{:.2f}\n".format
+FIXED_LINE = "{:<24.24}{:<10}{:>14.2f}{:>14.2f}{:>14.2f}{:>14.2f}\n".format
+FIXED_HEADER = "{:<24}{:<10}{:>14}{:>14}{:>14}{:>14}\n".format(
+    "NAME", "ROLE", "BASE", "BONUS", "INCENTIVES", "TOTAL")
+
+
+# -------------------------------
+# REPORT WRITER
+# -------------------------------
+class PayrollReportWriter:
+    """Stream a payroll report in large buffered chunks.
+
+    `out` is a file path, a binary file object, or None for stdout. A stdout without a binary
+    buffer (Jupyter, contextlib.redirect_stdout to a StringIO) gets the text as str.
+    """
+
+    FORMATS = ("text", "csv", "fixed")
+
+    def __init__(self, out=None, fmt="text", chunk_rows=50_000, buffer_size=1 << 20):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown report format: {fmt!r} (choose from {self.FORMATS})")
+        self.fmt = fmt
+        self.chunk_rows = chunk_rows
+        self._header_written = False
+        self._binary = True
+
+        if out is None:
+            sys.stdout.flush()          # Keep earlier print() output in order
+            self._file = getattr(sys.stdout, "buffer", None)
+            if self._file is None:      # Text-only stdout: write str, no bytes layer
+                self._file = sys.stdout
+                self._binary = False
+        elif isinstance(out, (str, os.PathLike)):
+            self._file = open(out, "wb", buffering=buffer_size)
+        else:
+            self._file = out            # Caller owns it, we only write
+        self._owns_file = isinstance(out, (str, os.PathLike))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def _write(self, text):
+        self._file.write(text.encode("utf-8") if self._binary else text)
+
+    def _write_header(self):
+        if self._header_written:
+            return
+        self._header_written = True
+        if self.fmt == "csv":
+            self._write(",".join(CSV_HEADER) + "\n")
+        elif self.fmt == "fixed":
+            self._write(FIXED_HEADER)
+
+    def _render(self, names, roles, base, bonus, incentives, totals):
+        if self.fmt == "text":
+            return "".join(map(TEXT_LINE, names, roles, base, totals))
+        if self.fmt == "fixed":
+            # str() first: the 24.24 field only truncates strings
+            return "".join(map(FIXED_LINE, map(str, names), roles, base, bonus, incentives, totals))
+        # csv: let the C writer handle quoting of names with commas
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(
+            zip(names, roles, base, bonus, incentives, totals))
+        return buffer.getvalue()
+
+    def write_table(self, table):
+        """Write every row of a PayrollTable."""
+        self._write_header()
+        totals = table.total_salaries()
+        for start in range(0, len(table), self.chunk_rows):
+            end = start + self.chunk_rows
+            # .tolist() turns a NumPy slice into Python floats in one C call
+            roles = [ROLE_NAMES[code] for code in table.roles[start:end].tolist()]
+            self._write(self._render(
+                table.names[start:end], roles,
+                table.base_salary[start:end].tolist(),
+                table.bonus[start:end].tolist(),
+                table.incentives[start:end].tolist(),
+                totals[start:end].tolist(),
+            ))
+
+    def write_employees(self, employees):
+        """Write Developer / Manager objects (converted to a table chunk by chunk)."""
+        chunk = []
+        for emp in employees:
+            chunk.append(emp)
+            if len(chunk) == self.chunk_rows:
+                self.write_table(PayrollTable.from_employees(chunk))
+                chunk = []
+        if chunk:
+            self.write_table(PayrollTable.from_employees(chunk))
+
+
+# -------------------------------
+# BENCHMARK: print() PER EMPLOYEE vs BUFFERED CHUNKS
+# -------------------------------
+def benchmark(n=1_000_000):
+    table = payroll_table.random_table(n)
+    employees = table.to_employees()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "print.txt")
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as file, contextlib.redirect_stdout(file):
+            for emp in employees:
+                payroll_table.payroll.display_employee(emp)
+        print(f"  display_employee() x {n:,}   : {time.perf_counter() - start:6.2f} s")
+
+        for fmt in PayrollReportWriter.FORMATS:
+            path = os.path.join(folder, f"report.{fmt}")
+            start = time.perf_counter()
+            with PayrollReportWriter(path, fmt) as writer:
+                writer.write_table(table)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path) / 2**20
+            print(f"  PayrollReportWriter {fmt:<5}     : {elapsed:6.2f} s  ({n / elapsed:,.0f} lines/s, {size:,.0f} MiB)")
+
+
+if __name__ == "__main__":
+    team = [Developer("Alice", 70000, 10000), Manager("Bob", 90000, 15000)]
+
+    for fmt in PayrollReportWriter.FORMATS:
+        with PayrollReportWriter(fmt=fmt) as writer:    # None -> stdout
+            writer.write_employees(team)
+        print()
+    # Output (text):
+    # Name: Alice, Role: Developer, Base Salary: ₹70000.00 | Total Salary: ₹80000.00
+    # Name: Bob, Role: Manager, Base Salary: ₹90000.00 | Total Salary: ₹105000.00
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |_________________________________________________________________________________________________|
+# | Feature              | Implementation                                                           |
+# | -------------------- | ------------------------------------------------------------------------ |
+# | Batched rendering    | One precompiled `str.format` mapped over a chunk, then `"".join()`       |
+# | Large buffered I/O   | Binary file with a 1 MiB buffer, one write per chunk                     |
+# | Formats              | text, csv (C `csv.writer`), fixed-width                                  |
+# | Sources              | `write_table()` for PayrollTable, `write_employees()` for objects        |
+# | Stdout               | `sys.stdout.buffer`, or str writes when stdout is text-only (Jupyter)    |
+# |______________________|__________________________________________________________________________|
@@ -0,0 +1,182 @@
+'''
+🪶 Compact Employees with __slots__ — "No __dict__ Per Object"
+Idea: Every normal Python object carries its own __dict__ to hold its attributes. For the payroll
+    classes (19. OOP Project-EmployeeSalary.py, 18. Python-OOP.py) that dict is bigger than the
+    data it stores, and with a million employees it dominates memory.
+
+    __slots__ tells Python the exact attribute names up front, so each instance stores them in
+    fixed slots instead of a dict.
+
+    class Point:
+        __slots__ = ("x", "y")   # only x and y can ever be set
+
+💡 Why useful?
+1. Far fewer bytes per object
+2. Slightly faster attribute access
+3. Typos like emp._bonsu = 5 raise AttributeError instead of silently creating a new attribute
+
+⚠️ Notes:
+1. Every class in the hierarchy must declare __slots__, otherwise a __dict__ comes back
+2. Subclasses only list their NEW attributes (the parent's slots are inherited)
+3. You can't add arbitrary attributes at run time any more (see 12. InstanceVsClassVariable.py)
+'''
+
+import sys
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+
+from lessons import load_lesson
+
+
+# -------------------------------
+# ABSTRACT CLASS: SLOTTED EMPLOYEE
+# -------------------------------
+class SlottedEmployee(ABC):     # ABC itself declares __slots__ = (), so no __dict__ sneaks in
+    __slots__ = ("_name", "_base_salary")
+
+    def __init__(self, name, base_salary):
+        self._name = name
+        self._base_salary = base_salary
+
+    @abstractmethod
+    def calculate_salary(self):
+        pass
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        if value:
+            self._name = value
+
+    @property
+    def base_salary(self):
+        return self._base_salary
+
+    @base_salary.setter
+    def base_salary(self, value):
+        if value >= 0:
+            self._base_salary = value
+
+    def get_details(self):
+        return f"Name: {self._name}, Base Salary: ₹{self._base_salary}"
+
+
+# -------------------------------
+# SLOTTED DEVELOPER
+# -------------------------------
+class SlottedDeveloper(SlottedEmployee):
+    __slots__ = ("_bonus",)     # Only the new attribute
+
+    def __init__(self, name, base_salary, bonus):
+        super().__init__(name, base_salary)
+        self._bonus = bonus
+
+    @property
+    def bonus(self):
+        return self._bonus
+
+    @bonus.setter
+    def bonus(self, value):
+        if value >= 0:
+            self._bonus = value
+
+    def calculate_salary(self):
+        return self.base_salary + self._bonus
+
+
+# -------------------------------
+# SLOTTED MANAGER
+# -------------------------------
+class SlottedManager(SlottedEmployee):
+    __slots__ = ("_incentives",)
+
+    def __init__(self, name, base_salary, incentives):
+        super().__init__(name, base_salary)
+        self._incentives = incentives
+
+    @property
+    def incentives(self):
+        return self._incentives
+
+    @incentives.setter
+    def incentives(self, value):
+        if value >= 0:
+            self._incentives = value
+
+    def calculate_salary(self):
+        return self.base_salary + self._incentives
+
+
+# -------------------------------
+# MEMORY BENCHMARK
+# -------------------------------
+def bytes_per_employee(developer_cls, manager_cls, names, salaries, extras):
+    """Memory allocated for the employee objects only (names and numbers are shared)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    employees = [
+        manager_cls(name, salary, extra) if i % 2 else developer_cls(name, salary, extra)
+        for i, (name, salary, extra) in enumerate(zip(names, salaries, extras))
+    ]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list that holds the objects
+    list_bytes = sys.getsizeof(employees)
+    return (after - before - list_bytes) / len(employees)
+
+
+def benchmark(n=1_000_000):
+    payroll = load_lesson("employee_salary")
+
+    # Build the field values once so both runs measure only the objects
+    names = [f"emp{i}" for i in range(n)]
+    salaries = [float(30_000 + i % 170_000) for i in range(n)]
+    extras = [float(i % 50_000) for i in range(n)]
+
+    start = time.perf_counter()
+    regular = bytes_per_employee(payroll.Developer, payroll.Manager, names, salaries, extras)
+    regular_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slotted = bytes_per_employee(SlottedDeveloper, SlottedManager, names, salaries, extras)
+    slotted_time = time.perf_counter() - start
+
+    print(f"{n:,} employees")
+    print(f"  regular (__dict__) : {regular:6.1f} bytes/employee  ({regular * n / 2**20:,.0f} MiB, built in {regular_time:.2f} s)")
+    print(f"  __slots__          : {slotted:6.1f} bytes/employee  ({slotted * n / 2**20:,.0f} MiB, built in {slotted_time:.2f} s)")
+    print(f"  saving             : {1 - slotted / regular:.0%}")
+
+
+if __name__ == "__main__":
+    dev = SlottedDeveloper("Alice", 70000, 10000)
+    mgr = SlottedManager("Bob", 90000, 15000)
+
+    print(dev.calculate_salary())   # Output: 80000
+    print(mgr.calculate_salary())   # Output: 105000
+
+    dev.bonus = -1                  # Ignored, same rule as the original setter
+    print(dev.bonus)                # Output: 10000
+
+    try:
+        dev.nickname = "Ali"        # ❌ No __dict__, so no new attributes
+    except AttributeError as error:
+        print("AttributeError:", error)
+
+    print(hasattr(dev, "__dict__")) # Output: False
+
+    benchmark()
+
+
+# ✅ Features Covered
+# |________________________________________________________________________________________________|
+# | Feature             | Implementation                                                           |
+# | ------------------- | ------------------------------------------------------------------------ |
+# | Compact objects     | `__slots__` on every class of the hierarchy (ABC has empty slots)        |
+# | Same API            | `name`, `base_salary`, `bonus`, `incentives` properties + validation     |
+# | Abstraction kept    | `SlottedEmployee.calculate_salary()` is still abstract                   |
+# | Benchmark           | `tracemalloc` bytes per employee for 1M regular vs slotted objects       |
+# |_____________________|__________________________________________________________________________|
@@ -0,0 +1,81 @@
+'''
+📚 Lesson Loader — "import a File Called '19. OOP Project-PayrollTable.py'"
+Idea: Lesson files are numbered ("19. OOP Project-PayrollTable.py"), so `import` can't reach
+    them - the name has dots and spaces. Several lessons build on each other, and they all need
+    the same small trick to load one another.
+
+    This module does it in ONE place. Every lesson gets a real, importable module name:
+
+        payroll_table = load_lesson("payroll_table")        # the module object
+        import lessons.payroll_table                         # same module, plain import
+
+    The name matters for multiprocessing. A worker process started with "spawn" (the default
+    on Windows and macOS) receives functions and classes by NAME - "lessons.line_counter.
+    _count_range_task" - and imports that name itself. Because importing `lessons` installs
+    the finder below, the worker can load the lesson file again without any help.
+
+⚠️ This file must stay next to the lessons, and that folder must be on sys.path (it is when
+    you run any lesson from it).
+'''
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+FOLDER = Path(__file__).resolve().parent
+
+# module name -> lesson file
+LESSONS = {
+    "table_engine": "03. Python - Print Formatting-TableEngine.py",
+    "column_renderer": "03. Python - Print Formatting-ColumnRenderer.py",
+    "async_reader": "10. FileOperation-AsyncReader.py",
+    "buffered_appender": "10. FileOperation-BufferedAppender.py",
+    "compressed": "10. FileOperation-Compressed.py",
+    "fast_decoder": "10. FileOperation-FastDecoder.py",
+    "line_counter": "10. FileOperation-LineCounter.py",
+    "line_index": "10. FileOperation-LineIndex.py",
+    "cached_area": "15. GetterSetters-CachedArea.py",
+    "batch_parser": "17. ClassMethods-BatchParser.py",
+    "config_registry": "17. ClassMethods-ConfigRegistry.py",
+    "email_validator": "17. ClassMethods-EmailValidator.py",
+    "async_bank": "18. Python-OOP-AsyncBank.py",
+    "bank_ledger": "18. Python-OOP-BankLedger.py",
+    "bank_wal": "18. Python-OOP-BankWAL.py",
+    "shape_array": "18. Python-OOP-ShapeArray.py",
+    "spatial_index": "18. Python-OOP-SpatialIndex.py",
+    "bulk_loader": "19. OOP Project-BulkLoader.py",
+    "employee_registry": "19. OOP Project-EmployeeRegistry.py",
+    "employee_salary": "19. OOP Project-EmployeeSalary.py",
+    "employee_store": "19. OOP Project-EmployeeStore.py",
+    "parallel_payroll": "19. OOP Project-ParallelPayroll.py",
+    "payroll_aggregates": "19. OOP Project-PayrollAggregates.py",
+    "payroll_report": "19. OOP Project-PayrollReport.py",
+    "payroll_table": "19. OOP Project-PayrollTable.py",
+    "slotted_employee": "19. OOP Project-SlottedEmployee.py",
+}
+
+# `lessons` acts as a package, so "lessons.payroll_table" is a valid module name
+__path__ = []
+
+
+class LessonFinder:
+    """Finds "lessons.<name>" modules in the numbered lesson files."""
+
+    @staticmethod
+    def find_spec(fullname, path=None, target=None):
+        package, _, name = fullname.partition(".")
+        if package != __name__ or name not in LESSONS:
+            return None
+        return importlib.util.spec_from_file_location(fullname, FOLDER / LESSONS[name])
+
+
+if not any(isinstance(finder, LessonFinder) for finder in sys.meta_path):
+    sys.meta_path.append(LessonFinder())
+
+
+def load_lesson(name):
+    """The lesson module registered as `name` (imported once, like any module)."""
+    if name not in LESSONS:
+        raise ModuleNotFoundError(f"No lesson named {name!r}, known: {sorted(LESSONS)}")
+    return importlib.import_module(f"{__name__}.{name}")